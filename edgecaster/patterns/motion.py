@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Any
 
 from edgecaster.patterns.activation import project_vertices
@@ -155,3 +156,43 @@ def build_push_preview(pattern: Pattern, anchor: Vec2, target: Vec2, rotation_de
         "rotation": rotation_deg,
         "delta": (dx, dy),
     }
+
+
+# Small LRU of recent push previews. Holding an arrow against the range clamp
+# or re-issuing the same target repeats identical inputs, so those calls
+# become dict hits. Each entry keeps its pattern alive so id() can't be reused.
+_PUSH_PREVIEW_CACHE: "OrderedDict[tuple, Tuple[Pattern, Dict[str, Any]]]" = OrderedDict()
+_PUSH_PREVIEW_CACHE_SIZE = 64
+
+
+def _pattern_signature(pattern: Pattern) -> tuple:
+    """
+    Everything build_push_preview reads from the pattern: every vertex
+    position and edge endpoint pair. Patterns are edited in place (e.g.
+    transform_pattern rewrites v.pos), so nothing coarser is safe. Building
+    the tuples is still far cheaper than the preview itself.
+    """
+    return (
+        id(pattern),
+        tuple([v.pos for v in pattern.vertices]),
+        tuple([(e.a, e.b) for e in pattern.edges]),
+    )
+
+
+def cached_push_preview(pattern: Pattern, anchor: Vec2, target: Vec2, rotation_deg: float, max_range: float = 5.0) -> Dict[str, Any]:
+    """
+    Memoized build_push_preview for UI paths that re-issue the same request.
+
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    key = (_pattern_signature(pattern), anchor, target, rotation_deg, max_range)
+    hit = _PUSH_PREVIEW_CACHE.get(key)
+    if hit is not None and hit[0] is pattern:
+        _PUSH_PREVIEW_CACHE.move_to_end(key)
+        return hit[1]
+
+    preview = build_push_preview(pattern, anchor, target, rotation_deg, max_range)
+    _PUSH_PREVIEW_CACHE[key] = (pattern, preview)
+    if len(_PUSH_PREVIEW_CACHE) > _PUSH_PREVIEW_CACHE_SIZE:
+        _PUSH_PREVIEW_CACHE.popitem(last=False)
+    return preview
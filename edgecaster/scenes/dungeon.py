@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import math
 import threading
+from operator import attrgetter
 import pygame
-from dataclasses import dataclass
-from typing import Literal, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Literal, NamedTuple, Optional
 
 from .base import Scene
 from edgecaster.game import Game
@@ -13,13 +15,33 @@ from edgecaster.systems.abilities import trigger_ability_effect
 from edgecaster.systems.targeting import predict_aim_preview
 from edgecaster.patterns import motion as pattern_motion
 from edgecaster.ui.ability_bar import AbilityBarState
-from edgecaster.systems.actions import get_action, describe_entity_for_look
+from edgecaster.systems.actions import (
+    find_action,
+    action_targeting,
+    action_sub_buttons,
+    describe_entity_for_look,
+)
 from edgecaster.visuals import VisualProfile, apply_visual_panel  
 from edgecaster.ui.widgets import WidgetContext, VBox, HBox, LabelWidget, ButtonWidget, ListWidget
 
 
 TargetKind = Literal["tile", "vertex", "look", "position"]
 
+# Raw key codes the scene tests directly (config overlay, push rotation).
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
+_K_RIGHT = pygame.K_RIGHT
+_K_E = pygame.K_e
+_K_CONFIRM_KEYS = frozenset((pygame.K_RETURN, pygame.K_SPACE))
+_K_LEFT_RIGHT = frozenset((pygame.K_LEFT, pygame.K_RIGHT))
+_K_ROTATE_KEYS = frozenset((pygame.K_q, pygame.K_e))
+
+# AbilityBarRenderer page-arrow hitboxes, fetched in one call per click.
+_get_arrow_rects = attrgetter("page_prev_rects", "page_next_rects")
+
+# TargetingSpec fields read when an ability enters TargetMode.
+_get_spec_fields = attrgetter("mode", "max_range", "neighbor_depth_param", "radius_param")
+
 
 @dataclass
 class TargetConstraints:
@@ -34,6 +56,26 @@ class TargetConstraints:
     use_param_radius: str | None = None       # e.g. "radius" for activate_all
 
 
+# id(TargetingSpec) -> (spec, mode, constraints). Specs live in the action
+# registry and are never mutated, so each one's constraints are built once;
+# the stored spec guards against id reuse after a hot-reload re-register.
+_spec_target_cache: dict[int, tuple[object, str | None, TargetConstraints]] = {}
+
+
+def _spec_target_args(spec) -> tuple[str | None, TargetConstraints]:
+    """(mode, constraints) that begin_target_mode gets for a TargetingSpec."""
+    entry = _spec_target_cache.get(id(spec))
+    if entry is None or entry[0] is not spec:
+        mode, max_range, neighbor_depth_param, radius_param = _get_spec_fields(spec)
+        constraints = TargetConstraints(
+            max_range=max_range,
+            neighbor_depth_param=neighbor_depth_param,
+            use_param_radius=radius_param,
+        )
+        entry = _spec_target_cache[id(spec)] = (spec, mode, constraints)
+    return entry[1], entry[2]
+
+
 @dataclass
 class TargetState:
     action: str
@@ -43,6 +85,8 @@ class TargetState:
     cursor_vertex: int | None = None
     constraints: TargetConstraints | None = None
     mode: str | None = None  # "terminus" or "aim" or None
+    # Kind-specific confirm handler, resolved once by begin_target_mode.
+    confirm: Callable[["DungeonScene", Game, "TargetState"], bool] | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         if self.constraints is None:
@@ -75,6 +119,21 @@ class DungeonUIState:
             self.hover_neighbors = []
 
 
+class _CommandContext(NamedTuple):
+    """Per-command state shared by the DungeonScene kind handlers."""
+    game: Game
+    renderer: object
+    manager: object
+    cmd: GameCommand
+    bar: AbilityBarState
+    t: TargetState | None
+    in_target_mode: bool
+    in_aim_mode: bool
+    push_mode: bool
+    push_pattern: object | None   # level pattern/anchor, resolved once when push_mode
+    push_anchor: tuple | None
+
+
 class DungeonScene(Scene):
     """The main roguelike dungeon scene."""
 
@@ -84,17 +143,17 @@ class DungeonScene(Scene):
         """Compute aim preview data in logic layer so renderer only draws."""
         ui = self.ui_state
         action_name = ui.aim_action
+        self._last_aim_inputs = (action_name, ui.hover_vertex, tuple(ui.hover_neighbors or ()))
         if not action_name or ui.hover_vertex is None:
             ui.aim_prediction = None
             return
 
-        try:
-            action_def = get_action(action_name)
-        except KeyError:
+        action_def = find_action(action_name)
+        if action_def is None:
             ui.aim_prediction = None
             return
 
-        spec = getattr(action_def, "targeting", None)
+        spec = action_def.targeting
         if not spec or spec.kind != "vertex" or spec.mode != "aim":
             ui.aim_prediction = None
             return
@@ -109,10 +168,26 @@ class DungeonScene(Scene):
         except Exception:
             ui.aim_prediction = None
 
+    def _refresh_aim_prediction_if_changed(self, game: Game) -> None:
+        """
+        Hover-path variant: skip the recompute when the aim inputs match the
+        last refresh. update() still refreshes every frame, which picks up
+        param and board changes.
+        """
+        ui = self.ui_state
+        key = (ui.aim_action, ui.hover_vertex, tuple(ui.hover_neighbors or ()))
+        if key == self._last_aim_inputs:
+            return
+        self._refresh_aim_prediction(game)
+
     def __init__(self) -> None:
         # Keep the Game instance across pauses/inventory.
         self.game: Game | None = None
         self.ui_state = DungeonUIState()
+        # (aim_action, hover_vertex, hover_neighbors) at the last aim refresh.
+        self._last_aim_inputs: tuple | None = None
+        # _halo_key() of the last neighbor halo built by _aim_at_vertex.
+        self._last_halo_key: tuple | None = None
         # --- Widget PoC: scene-owned widget tree (view objects) ---
         self._debug_widget_root = HBox(spacing=12, padding=10, valign="top")
         self._debug_list = ListWidget(
@@ -138,9 +213,14 @@ class DungeonScene(Scene):
         self._debug_widget_root.rect = pygame.Rect(12, 120, 420, 170)
 
         self._pending_door_toggle: dict[tuple[int, int], object] | None = None
+        # Latest unprocessed mouse_move position (display coords); motion is
+        # coalesced so only the last position per frame updates hover state.
+        self._pending_mouse_pos: tuple[int, int] | None = None
         # Scene-level input mapper for "pure game" actions
         # refactor: migrate to a shared input layer; DungeonScene should consume a GameCommand queue only.
         self.input = GameInput()
+        # manager.keybindings dict last pushed into self.input (see handle_event).
+        self._synced_keybindings: dict | None = None
         self._started = False
         self._old_urgent_cb = None
 
@@ -161,11 +241,14 @@ class DungeonScene(Scene):
     # ------------------------------------------------------------------ #
     # Live-loop hooks
     def handle_event(self, event, manager: "SceneManager") -> None:  # type: ignore[name-defined]
-        # Keep keybindings in sync with manager settings.
-        if hasattr(manager, "keybindings"):
-            kb = manager.keybindings
+        # Keep keybindings in sync with manager settings. The keybinds scene
+        # replaces manager.keybindings on every change, so only a new dict
+        # needs re-merging into the input mapper.
+        kb = getattr(manager, "keybindings", None)
+        if kb is not None and kb is not self._synced_keybindings:
             self.input.set_bindings(kb.get("bindings", {}))
             self.input.set_move_bindings(kb.get("move_bindings", {}))
+            self._synced_keybindings = kb
         game, renderer = self._ensure_game(manager)
         if game is None:
             manager.set_scene(None)
@@ -229,6 +312,9 @@ class DungeonScene(Scene):
             manager.set_scene(None)
             return
 
+        # Apply the frame's last mouse position before anything reads hover state.
+        self._flush_mouse_move(game, renderer)
+
         # Legacy flags still respected
         if getattr(renderer, "quit_requested", False) or getattr(renderer, "pause_requested", False):
             renderer.quit_requested = False
@@ -357,6 +443,7 @@ class DungeonScene(Scene):
             self.game = Game(cfg, rng, character=char)
             # ability bar view-model
             self.game.ability_bar_state = AbilityBarState()
+            self.game.ability_reorder_open = False
 
             # Precompute world map cache in the background
             if not getattr(self.game, "world_map_thread_started", False):
@@ -553,7 +640,6 @@ class DungeonScene(Scene):
     def begin_target_mode(
         self,
         game: Game,
-        *,
         action: str,
         kind: TargetKind,
         mode: str | None = None,
@@ -564,8 +650,11 @@ class DungeonScene(Scene):
             constraints = TargetConstraints()
         actor_id = origin_actor_id or getattr(game, "player_id", None)
         origin_tile = None
-        if actor_id is not None and getattr(game, "actors", None):
-            origin_tile = game.actors[actor_id].pos
+        if actor_id is not None:
+            # Game.actors is a property over _level(); read it once.
+            actors = getattr(game, "actors", None)
+            if actors:
+                origin_tile = actors[actor_id].pos
 
         tstate = TargetState(
             action=action,
@@ -577,68 +666,73 @@ class DungeonScene(Scene):
         )
         self.ui_state.target = tstate
 
+        # Resolve the kind-specific entry once; it also picks the confirm
+        # handler so confirm_target never has to branch on kind again.
+        begin = self._BEGIN_TARGET_BY_KIND.get(kind)
+        if begin is not None:
+            begin(self, game, tstate, origin_tile)
+
+    # Per-kind TargetMode entry points (selected via _BEGIN_TARGET_BY_KIND).
+    def _begin_look_target(self, game: Game, tstate: TargetState, origin_tile) -> None:
         # Look-style generic tile cursor (no legacy flags, no game.awaiting_terminus).
-        if kind == "look":
-            if origin_tile is not None:
-                tstate.cursor_tile = origin_tile
-                self.ui_state.target_cursor = origin_tile
+        # Confirm is routed to _confirm_look by _handle_command.
+        if origin_tile is not None:
+            tstate.cursor_tile = origin_tile
+            self.ui_state.target_cursor = origin_tile
+
+    def _begin_tile_target(self, game: Game, tstate: TargetState, origin_tile) -> None:
+        if tstate.mode != "terminus":
+            tstate.confirm = DungeonScene._confirm_tile_target
             return
 
         # Backwards-compat bridge for rune terminus targeting:
-        if kind == "tile" and mode == "terminus":
-            if hasattr(game, "begin_place_mode"):
-                # Ensure game-side place state (e.g. place_range) is initialized.
-                game.begin_place_mode()
-            game.awaiting_terminus = True
-            self.ui_state.target_cursor = origin_tile or (0, 0)
-
-        if kind == "vertex":
-            # Enter generic vertex targeting (e.g. activate_all / activate_seed).
-            self.ui_state.aim_action = action
-
-            # Seed hover at nearest vertex to the origin tile (usually the player).
-            idx = None
-            if origin_tile is not None:
-                tx, ty = origin_tile
-                wx = tx + 0.5
-                wy = ty + 0.5
-                idx = game.nearest_vertex((wx, wy))
-
-            tstate.cursor_vertex = idx
-            self.ui_state.hover_vertex = idx
-
-            # Seed the neighbor set if this action has a neighbor-depth constraint.
-            if idx is not None and tstate.constraints and tstate.constraints.neighbor_depth_param:
-                depth = game.get_param_value(action, tstate.constraints.neighbor_depth_param)
-                self.ui_state.hover_neighbors = game.neighbor_set_depth(idx, depth)
-            else:
-                self.ui_state.hover_neighbors = []
-
-            self._refresh_aim_prediction(game)
+        tstate.confirm = DungeonScene._confirm_terminus_target
+        if hasattr(game, "begin_place_mode"):
+            # Ensure game-side place state (e.g. place_range) is initialized.
+            game.begin_place_mode()
+        game.awaiting_terminus = True
+        self.ui_state.target_cursor = origin_tile or (0, 0)
+
+    def _begin_vertex_target(self, game: Game, tstate: TargetState, origin_tile) -> None:
+        # Enter generic vertex targeting (e.g. activate_all / activate_seed).
+        tstate.confirm = DungeonScene._confirm_vertex_target
+        self.ui_state.aim_action = tstate.action
+
+        # Seed hover at nearest vertex to the origin tile (usually the player).
+        idx = None
+        if origin_tile is not None:
+            tx, ty = origin_tile
+            wx = tx + 0.5
+            wy = ty + 0.5
+            idx = game.nearest_vertex((wx, wy))
 
-        if kind == "position":
-            # Push pattern targeting: seed at pattern COM (or player tile).
-            self.ui_state.aim_action = action
-            lvl = game._level()
-            pattern = getattr(lvl, "pattern", None)
-            anchor = getattr(lvl, "pattern_anchor", None)
-            max_range = constraints.max_range or 5.0
-            if pattern and anchor and pattern.vertices:
-                com = pattern_motion.center_of_mass(pattern)
-                com_world = (com[0] + anchor[0], com[1] + anchor[1])
-                tstate.cursor_tile = (int(round(com_world[0])), int(round(com_world[1])))
-                self.ui_state.target_cursor = tstate.cursor_tile
-                self.ui_state.push_target = com_world
-                self.ui_state.push_rotation = 0.0
-                self.ui_state.push_preview = pattern_motion.build_push_preview(
-                    pattern, anchor, com_world, 0.0, max_range
-                )
-            elif origin_tile is not None:
-                tstate.cursor_tile = origin_tile
-                self.ui_state.target_cursor = origin_tile
-                self.ui_state.push_target = (origin_tile[0], origin_tile[1])
-                self.ui_state.push_rotation = 0.0
-                self.ui_state.push_preview = None
+        # Seeds the neighbor set too if this action has a neighbor-depth constraint.
+        self._aim_at_vertex(game, tstate, idx)
+
+    def _begin_position_target(self, game: Game, tstate: TargetState, origin_tile) -> None:
+        # Push pattern targeting: seed at pattern COM (or player tile).
+        tstate.confirm = DungeonScene._confirm_position_target
+        self.ui_state.aim_action = tstate.action
+        lvl = game._level()
+        pattern = lvl.pattern
+        anchor = lvl.pattern_anchor
+        max_range = tstate.constraints.max_range or 5.0
+        if pattern and anchor and pattern.vertices:
+            com = pattern_motion.center_of_mass(pattern)
+            com_world = (com[0] + anchor[0], com[1] + anchor[1])
+            tstate.cursor_tile = (int(round(com_world[0])), int(round(com_world[1])))
+            self.ui_state.target_cursor = tstate.cursor_tile
+            self.ui_state.push_target = com_world
+            self.ui_state.push_rotation = 0.0
+            self.ui_state.push_preview = pattern_motion.cached_push_preview(
+                pattern, anchor, com_world, 0.0, max_range
+            )
+        elif origin_tile is not None:
+            tstate.cursor_tile = origin_tile
+            self.ui_state.target_cursor = origin_tile
+            self.ui_state.push_target = (origin_tile[0], origin_tile[1])
+            self.ui_state.push_rotation = 0.0
+            self.ui_state.push_preview = None
 
     def cancel_target_mode(self, game: Game) -> None:
         t = self.ui_state.target
@@ -651,7 +745,7 @@ class DungeonScene(Scene):
         self.ui_state.push_rotation = 0.0
         self.ui_state.push_preview = None
         # Clear legacy terminus flag for any tile/terminus targeting.
-        if t and t.kind == "tile" and getattr(t, "mode", None) == "terminus":
+        if t and t.kind == "tile" and t.mode == "terminus":
             game.awaiting_terminus = False
 
     def confirm_target(self, game: Game) -> None:
@@ -660,46 +754,54 @@ class DungeonScene(Scene):
         if not t:
             return
 
-        # TILE TARGETING (e.g. Kochbender 'place' / rune terminus)
-        if t.kind == "tile":
-            if t.cursor_tile is None:
-                return
+        # The handler was chosen when target mode began; it returns False
+        # when there is nothing to confirm yet (target mode stays active).
+        confirm = t.confirm
+        if confirm is not None and not confirm(self, game, t):
+            return
 
-            if getattr(t, "mode", None) == "terminus":
-                # Generic "terminus" semantics: place a rune terminus at the tile.
-                if hasattr(game, "try_place_terminus"):
-                    game.try_place_terminus(t.cursor_tile)
-            else:
-                # Future: tile-based ranged attacks, teleports, etc.
-                trigger_ability_effect(
-                    game,
-                    t.action,
-                    target_tile=t.cursor_tile,
-                )
+        # Clear target + legacy flags
+        self.cancel_target_mode(game)
 
+    # Per-kind confirm handlers (attached to TargetState.confirm on entry).
+    def _confirm_terminus_target(self, game: Game, t: TargetState) -> bool:
+        # Generic "terminus" semantics: place a rune terminus at the tile.
+        if t.cursor_tile is None:
+            return False
+        if hasattr(game, "try_place_terminus"):
+            game.try_place_terminus(t.cursor_tile)
+        return True
+
+    def _confirm_tile_target(self, game: Game, t: TargetState) -> bool:
+        # Future: tile-based ranged attacks, teleports, etc.
+        if t.cursor_tile is None:
+            return False
+        trigger_ability_effect(game, t.action, target_tile=t.cursor_tile)
+        return True
+
+    def _confirm_vertex_target(self, game: Game, t: TargetState) -> bool:
         # VERTEX TARGETING (e.g. activate_all / activate_seed)
-        elif t.kind == "vertex":
-            if t.cursor_vertex is None:
-                return
-
-            # Pass a generic vertex target; the action implementation decides how to use it.
-            trigger_ability_effect(
-                game,
-                t.action,
-                hover_vertex=t.cursor_vertex,
-            )
+        if t.cursor_vertex is None:
+            return False
+        # Pass a generic vertex target; the action implementation decides how to use it.
+        trigger_ability_effect(game, t.action, hover_vertex=t.cursor_vertex)
+        return True
 
+    def _confirm_position_target(self, game: Game, t: TargetState) -> bool:
         # POSITION TARGETING (push_pattern)
-        elif t.kind == "position":
-            tgt = self.ui_state.push_target or t.cursor_tile
-            if tgt is None:
-                return
-            rot = self.ui_state.push_rotation
-            trigger_ability_effect(game, t.action, target_pos=tgt, rotation_deg=rot)
-
-        # Clear target + legacy flags
-        self.cancel_target_mode(game)
-
+        tgt = self.ui_state.push_target or t.cursor_tile
+        if tgt is None:
+            return False
+        rot = self.ui_state.push_rotation
+        trigger_ability_effect(game, t.action, target_pos=tgt, rotation_deg=rot)
+        return True
+
+    _BEGIN_TARGET_BY_KIND = {
+        "look": _begin_look_target,
+        "tile": _begin_tile_target,
+        "vertex": _begin_vertex_target,
+        "position": _begin_position_target,
+    }
 
     def _confirm_look(self, game: Game, renderer, manager: "SceneManager") -> None:  # type: ignore[name-defined]
         """Resolve a 'look' target into an inspect popup.
@@ -796,7 +898,7 @@ class DungeonScene(Scene):
             # no targeting, also clear old vertex preview
             self.ui_state.hover_vertex = None
             self.ui_state.hover_neighbors = []
-            self._refresh_aim_prediction(game)
+            self._refresh_aim_prediction_if_changed(game)
             return
 
         mx, my = surface_pos
@@ -809,41 +911,90 @@ class DungeonScene(Scene):
             if game.world.in_bounds(tx, ty):
                 t.cursor_tile = (tx, ty)
                 self.ui_state.target_cursor = (tx, ty)
-                if getattr(t, "action", None) == "push_pattern":
+                if t.action == "push_pattern":
                     lvl = game._level()
-                    pattern = getattr(lvl, "pattern", None)
-                    anchor = getattr(lvl, "pattern_anchor", None)
+                    pattern = lvl.pattern
+                    anchor = lvl.pattern_anchor
                     if pattern and anchor and pattern.vertices:
                         com = pattern_motion.center_of_mass(pattern)
                         com_world = (com[0] + anchor[0], com[1] + anchor[1])
                         dx = tx - com_world[0]
                         dy = ty - com_world[1]
-                        dist = (dx * dx + dy * dy) ** 0.5
-                        max_range = getattr(t.constraints, "max_range", None) if t.constraints else None
+                        max_range = t.constraints.max_range
                         if max_range is None:
                             max_range = 5.0
-                        if dist > max_range and dist > 0:
-                            scale = max_range / dist
+                        d2 = dx * dx + dy * dy
+                        if d2 > max_range * max_range:
+                            scale = max_range / math.sqrt(d2)
                             dx *= scale
                             dy *= scale
                         tgt = (com_world[0] + dx, com_world[1] + dy)
                         self.ui_state.push_target = tgt
-                        self.ui_state.push_preview = pattern_motion.build_push_preview(
+                        self.ui_state.push_preview = pattern_motion.cached_push_preview(
                             pattern, anchor, tgt, self.ui_state.push_rotation, max_range
                         )
 
         elif t.kind == "vertex":
             idx = game.nearest_vertex((wx, wy))
-            self.ui_state.hover_vertex = idx
-            t.cursor_vertex = idx
+            # Dragging across one vertex's hit region is the common case:
+            # neighbors + prediction are already current for it, so skip the
+            # BFS and preview rebuild -- unless the depth param or the pattern
+            # changed since the halo was built.
+            if (
+                idx == self.ui_state.hover_vertex
+                and idx == t.cursor_vertex
+                and self._halo_key(game, t, idx) == self._last_halo_key
+            ):
+                return
+            self._aim_at_vertex(game, t, idx)
 
-            if idx is not None and t.constraints and t.constraints.neighbor_depth_param:
-                depth = game.get_param_value(t.action, t.constraints.neighbor_depth_param)
-                self.ui_state.hover_neighbors = game.neighbor_set_depth(idx, depth)
-            else:
-                self.ui_state.hover_neighbors = []
+    # ------------------------------------------------------------------ #
+    # Shared cursor helpers (keyboard + mouse targeting)
+    # ------------------------------------------------------------------ #
+    def _step_cursor(
+        self,
+        game: Game,
+        t: TargetState,
+        vec: tuple[int, int],
+        *,
+        sync_target_cursor: bool = True,
+    ) -> tuple[int, int] | None:
+        """Step the tile cursor by vec; return the new tile, or None at the map edge."""
+        tx, ty = t.cursor_tile or game.actors[game.player_id].pos
+        dx, dy = vec
+        nt = (tx + dx, ty + dy)
+        if not game.world.in_bounds(*nt):
+            return None
+        t.cursor_tile = nt
+        if sync_target_cursor:
+            self.ui_state.target_cursor = nt
+        return nt
+
+    def _halo_key(self, game: Game, t: TargetState, idx: int | None) -> tuple:
+        """Everything the neighbor halo for idx depends on (see _aim_at_vertex)."""
+        depth_param = t.constraints.neighbor_depth_param
+        if idx is None or not depth_param:
+            return (idx, None)
+        depth = game.get_param_value(t.action, depth_param)
+        pattern = game._level().pattern
+        return (idx, depth, id(pattern), len(pattern.vertices), len(pattern.edges))
+
+    def _aim_at_vertex(self, game: Game, t: TargetState, idx: int | None) -> None:
+        """Point vertex targeting at idx and rebuild the neighbor halo + aim preview."""
+        ui = self.ui_state
+        t.cursor_vertex = idx
+        ui.hover_vertex = idx
+
+        # Update neighbor halo if this action has depth-based neighbors.
+        key = self._halo_key(game, t, idx)
+        depth = key[1]
+        if depth is not None:
+            ui.hover_neighbors = game.neighbor_set_depth(idx, depth)
+        else:
+            ui.hover_neighbors = []
+        self._last_halo_key = key
 
-            self._refresh_aim_prediction(game)
+        self._refresh_aim_prediction_if_changed(game)
 
     # ------------------------------------------------------------------ #
     # Command handling
@@ -861,84 +1012,78 @@ class DungeonScene(Scene):
         This is where scene-level logic lives: we can query game/renderer
         state (e.g. awaiting_terminus, dialogs, targeting) and decide
         whether to act or ignore the command.
-        """
-        import pygame  # local to avoid circulars in some environments
 
+        Modal states (reorder overlay, config overlay, target modes) are
+        checked first as guard clauses; everything else is routed through
+        the _KIND_HANDLERS table.
+        """
         ui = self.ui_state
 
-        def _set_ui(attr: str, value) -> None:
-            setattr(ui, attr, value)
-            if renderer is not None and hasattr(renderer, attr):
-                setattr(renderer, attr, value)
-
-        def _set_aim_action(value: str | None) -> None:
-            _set_ui("aim_action", value)
-            self._refresh_aim_prediction(game)
-
-        def _update_hover(surface_pos: tuple[int, int]) -> None:
-            """Scene-side hover resolver; updates ui_state (and renderer for compatibility)."""
-            aim = ui.aim_action
-            if not aim:
-                _set_ui("hover_vertex", None)
-                _set_ui("hover_neighbors", [])
-                self._refresh_aim_prediction(game)
-                return
-
-            try:
-                action_def = get_action(aim)
-            except KeyError:
-                _set_ui("hover_vertex", None)
-                _set_ui("hover_neighbors", [])
-                self._refresh_aim_prediction(game)
-                return
-
-            spec = getattr(action_def, "targeting", None)
-            if not spec or spec.kind != "vertex":
-                _set_ui("hover_vertex", None)
-                _set_ui("hover_neighbors", [])
-                self._refresh_aim_prediction(game)
-                return
-
-            mx, my = surface_pos
-            wx = (mx - renderer.origin_x) / renderer.tile
-            wy = (my - renderer.origin_y) / renderer.tile
-            idx = game.nearest_vertex((wx, wy))
-            _set_ui("hover_vertex", idx)
-            if idx is not None and spec.neighbor_depth_param:
-                depth = game.get_param_value(aim, spec.neighbor_depth_param)
-                _set_ui("hover_neighbors", game.neighbor_set_depth(idx, depth))
-            else:
-                _set_ui("hover_neighbors", [])
-            self._refresh_aim_prediction(game)
-
         kind = cmd.kind
         key = cmd.raw_key
         vec = cmd.vector
 
+        # Mouse hover is the most frequent command by far, and all it does is
+        # remember the position: the cursor/aim update runs once in
+        # _flush_mouse_move (next command or next update()). Skip the bar sync
+        # and mode resolution below; only the reorder/config overlays, which
+        # swallow it, need checking.
+        if kind == "mouse_move":
+            if (
+                cmd.mouse_pos is not None
+                and not game.ability_reorder_open
+                and not (ui.config_open and ui.config_action)
+            ):
+                self._pending_mouse_pos = cmd.mouse_pos
+            return
+
+        # Any other command sees hover state as of the latest mouse position.
+        if self._pending_mouse_pos is not None:
+            self._flush_mouse_move(game, renderer)
+
+        # Plain walking is the common gameplay command: with no target mode,
+        # overlay or pending door prompt up, none of the guards below apply.
+        if (
+            kind == "move"
+            and vec is not None
+            and ui.target is None
+            and not self._pending_door_toggle
+            and not game.ability_reorder_open
+            and not (ui.config_open and ui.config_action)
+        ):
+            game.queue_player_move(vec)
+            return
+
         # AbilityBarState is the single source of truth for ability ordering
         # and selection; renderer only draws via AbilityBarRenderer.
-        bar = getattr(game, "ability_bar_state", None)
+        # (Set as a plain instance attribute by _ensure_game.)
+        bar = game.__dict__.get("ability_bar_state")
         if bar is None:
             bar = AbilityBarState()
             game.ability_bar_state = bar
         bar.sync_from_game(game)
 
-        t = getattr(self.ui_state, "target", None)
+        # Read the target fields once; every mode flag below is built from these locals.
+        t = ui.target
         in_target_mode = t is not None
-        in_terminus_mode = bool(
-            in_target_mode and t.kind == "tile" and getattr(t, "mode", None) == "terminus"
-        )
-        in_aim_mode = bool(
-            in_target_mode and t.kind == "vertex" and getattr(t, "mode", None) == "aim"
-        )
-        aim_action = ui.aim_action
-        push_mode = bool(in_target_mode and t and getattr(t, "action", "") == "push_pattern")
-
-        in_look_mode = bool(in_target_mode and t and t.kind == "look")
+        if in_target_mode:
+            t_kind = t.kind
+            t_mode = t.mode
+            t_action = t.action
+        else:
+            t_kind = t_mode = t_action = None
+        in_terminus_mode = t_kind == "tile" and t_mode == "terminus"
+        in_aim_mode = t_kind == "vertex" and t_mode == "aim"
+        push_mode = t_action == "push_pattern"
+        in_look_mode = t_kind == "look"
+        if push_mode:
+            push_pattern, push_anchor = self._push_subject(game)
+        else:
+            push_pattern = push_anchor = None
 
         # If we're in unified TargetMode and the user presses confirm, resolve it here.
         if in_target_mode and kind == "confirm":
-            if t and t.kind == "look":
+            if in_look_mode:
                 self._confirm_look(game, renderer, manager)
             else:
                 self.confirm_target(game)
@@ -947,105 +1092,29 @@ class DungeonScene(Scene):
         # ------------------------------------------------------------
         # Ability reordering overlay (when open, swallow most commands)
         # ------------------------------------------------------------
-        if getattr(game, "ability_reorder_open", False):
-            if kind == "escape":
-                game.ability_reorder_open = False
-                return
-            if kind == "confirm":
-                game.ability_reorder_open = False
-                # keep active action aligned with selected item
-                sel_act = bar.action_at_index(bar.selected_index)
-                if sel_act:
-                    bar.set_active(sel_act)
-                return
-            if kind == "move" and vec is not None:
-                dx, dy = vec
-                if dy:
-                    bar.move_selection(dy)
-                if dx:
-                    bar.move_selected_item(dx)
-                # keep page in view of selection
-                if bar.selected_index // bar.page_size != bar.page:
-                    bar.page = bar.selected_index // bar.page_size
-                return
-
-            if kind == "ability_page_prev":
-                bar.prev_page()
-                # Snap selection to first slot on the new page
-                bar.selected_index = bar.page * bar.page_size
-                return
-            if kind == "ability_page_next":
-                bar.next_page()
-                bar.selected_index = bar.page * bar.page_size
-                return
-            # ignore other commands while reorder UI is active
+        if game.ability_reorder_open:
+            self._handle_reorder_command(game, bar, kind, vec)
             return
 
+        ctx = _CommandContext(
+            game, renderer, manager, cmd, bar, t,
+            in_target_mode, in_aim_mode, push_mode, push_pattern, push_anchor,
+        )
 
         # ------------------------------------------------------------
-        # 0) Global-ish keys: Escape, fullscreen, help
+        # 0) Global-ish keys: Escape, ability manager
         # ------------------------------------------------------------
-        if kind == "escape":
-            # First: cancel unified target mode if active.
-            if in_target_mode:
-                self.cancel_target_mode(game)
-                return
-
-            # Next: close config overlay if open.
-            if self.ui_state.config_open:
-                _set_ui("config_open", False)
-                return
-
-            # Otherwise: normal ESC in the dungeon → request pause.
-            renderer.pause_requested = True
-            renderer.quit_requested = True
-            return
-
-        if kind == "open_abilities":
-            game.ability_reorder_open = True
-            # select current active ability if possible
-            if bar.active_action and bar.active_action in bar.order:
-                bar.selected_index = bar.order.index(bar.active_action)
-                bar.page = bar.selected_index // bar.page_size
+        handler = self._GLOBAL_KIND_HANDLERS.get(kind)
+        if handler is not None:
+            handler(self, ctx)
             return
 
         # ------------------------------------------------------------
         # 2) Config overlay (always takes precedence while open)
         # ------------------------------------------------------------
 
-        if self.ui_state.config_open and self.ui_state.config_action:
-            params = game.param_view(self.ui_state.config_action)
-
-            if key in (pygame.K_RETURN, pygame.K_SPACE):
-                _set_ui("config_open", False)
-                return
-
-            if key == pygame.K_UP:
-                _set_ui(
-                    "config_selection",
-                    (self.ui_state.config_selection - 1) % max(1, len(params)),
-                )
-                return
-
-            if key == pygame.K_DOWN:
-                _set_ui(
-                    "config_selection",
-                    (self.ui_state.config_selection + 1) % max(1, len(params)),
-                )
-                return
-
-            if key in (pygame.K_LEFT, pygame.K_RIGHT):
-                if params:
-                    param_key = params[self.ui_state.config_selection]["key"]
-                    delta = 1 if key == pygame.K_RIGHT else -1
-                    changed, msg = game.adjust_param(
-                        self.ui_state.config_action,
-                        param_key,
-                        delta,
-                    )
-                    # msg is available if you want to surface it later
-                return
-
+        if ui.config_open and ui.config_action:
+            self._handle_config_command(game, renderer, key)
             # Other commands do nothing while config overlay is open
             return
 
@@ -1053,21 +1122,12 @@ class DungeonScene(Scene):
         # 3) Terminus targeting mode
         # ------------------------------------------------------------
         if in_terminus_mode:
-            if kind == "move" and vec is not None and in_target_mode and t.kind == "tile":
-                tx, ty = t.cursor_tile or game.actors[game.player_id].pos
-                dx, dy = vec
-                nt = (tx + dx, ty + dy)
-                if game.world.in_bounds(*nt):
-                    t.cursor_tile = nt
-                    self.ui_state.target_cursor = nt
-                return
-
-            if kind == "confirm" and in_target_mode:
-                self.confirm_target(game)
+            if kind == "move" and vec is not None:
+                self._step_cursor(game, t, vec)
                 return
 
             # Let mouse_* commands pass through to the mouse handler.
-            if kind not in ("mouse_click", "mouse_move", "mouse_wheel"):
+            if kind not in ("mouse_click", "mouse_wheel"):
                 # Everything else (examine, pickup, etc.) is ignored
                 # while we're choosing a terminus.
                 return
@@ -1075,33 +1135,13 @@ class DungeonScene(Scene):
         # ------------------------------------------------------------
         # 4) Vertex targeting mode (activate_all / activate_seed)
         # ------------------------------------------------------------
-        if in_target_mode and t and t.kind == "vertex":
+        if t_kind == "vertex":
             # Arrow / WASD: move a logical tile cursor and pick nearest vertex.
             if kind == "move" and vec is not None:
-                tx, ty = t.cursor_tile or game.actors[game.player_id].pos
-                dx, dy = vec
-                nt = (tx + dx, ty + dy)
-                if game.world.in_bounds(*nt):
-                    t.cursor_tile = nt
-
+                nt = self._step_cursor(game, t, vec, sync_target_cursor=False)
+                if nt is not None:
                     # Aim at the vertex nearest to the center of this tile.
-                    wx = nt[0] + 0.5
-                    wy = nt[1] + 0.5
-                    idx = game.nearest_vertex((wx, wy))
-                    t.cursor_vertex = idx
-                    ui.hover_vertex = idx
-
-                    # Update neighbor halo if this action has depth-based neighbors.
-                    if idx is not None and t.constraints and t.constraints.neighbor_depth_param:
-                        depth = game.get_param_value(
-                            t.action,
-                            t.constraints.neighbor_depth_param,
-                        )
-                        ui.hover_neighbors = game.neighbor_set_depth(idx, depth)
-                    else:
-                        ui.hover_neighbors = []
-
-                    self._refresh_aim_prediction(game)
+                    self._aim_at_vertex(game, t, game.nearest_vertex((nt[0] + 0.5, nt[1] + 0.5)))
 
                 # Always swallow movement while targeting, even if we hit a boundary.
                 return
@@ -1116,25 +1156,21 @@ class DungeonScene(Scene):
         #      - Q/E rotate the push direction
         #      While active, player movement is frozen.
         # ------------------------------------------------------------
-        if push_mode and t and t.kind == "position":
+        if push_mode and t_kind == "position":
             # Keyboard rotation with Q/E
-            if key in (pygame.K_q, pygame.K_e):
-                delta_deg = 15 if key == pygame.K_e else -15
+            if key in _K_ROTATE_KEYS:
+                delta_deg = 15 if key == _K_E else -15
                 ui.push_rotation = (ui.push_rotation + delta_deg) % 360
 
-                if self.ui_state.push_target and t and t.constraints:
-                    lvl = game._level()
-                    pattern = getattr(lvl, "pattern", None)
-                    anchor = getattr(lvl, "pattern_anchor", None)
-                    max_range = getattr(t.constraints, "max_range", 5.0)
-                    if pattern and anchor and getattr(pattern, "vertices", None):
-                        self.ui_state.push_preview = pattern_motion.build_push_preview(
-                            pattern,
-                            anchor,
-                            self.ui_state.push_target,
-                            self.ui_state.push_rotation,
-                            max_range,
-                        )
+                if ui.push_target and push_pattern is not None:
+                    max_range = t.constraints.max_range
+                    ui.push_preview = pattern_motion.cached_push_preview(
+                        push_pattern,
+                        push_anchor,
+                        ui.push_target,
+                        ui.push_rotation,
+                        max_range,
+                    )
 
                 # Swallow Q/E so they don’t do anything else while targeting
                 return
@@ -1144,15 +1180,13 @@ class DungeonScene(Scene):
                 dx, dy = vec
 
                 # Get current pattern center-of-mass in world coords
-                lvl = game._level()
-                pattern = getattr(lvl, "pattern", None)
-                anchor = getattr(lvl, "pattern_anchor", None)
-                if pattern and anchor and getattr(pattern, "vertices", None):
+                pattern, anchor = push_pattern, push_anchor
+                if pattern is not None:
                     com = pattern_motion.center_of_mass(pattern)
                     com_world = (com[0] + anchor[0], com[1] + anchor[1])
 
                     # Current displacement from COM → target
-                    cur_tgt = self.ui_state.push_target or com_world
+                    cur_tgt = ui.push_target or com_world
                     cur_dx = cur_tgt[0] - com_world[0]
                     cur_dy = cur_tgt[1] - com_world[1]
 
@@ -1161,24 +1195,25 @@ class DungeonScene(Scene):
                     new_dy = cur_dy + dy
 
                     # Clamp to max_range if needed
-                    max_range = getattr(t.constraints, "max_range", None) if t.constraints else None
+                    max_range = t.constraints.max_range
                     if max_range is None:
                         max_range = 5.0
-                    dist = (new_dx * new_dx + new_dy * new_dy) ** 0.5
-                    if dist > max_range and dist > 0:
-                        scale = max_range / dist
+                    # Compare squared lengths; only pay for the sqrt when clamping.
+                    d2 = new_dx * new_dx + new_dy * new_dy
+                    if d2 > max_range * max_range:
+                        scale = max_range / math.sqrt(d2)
                         new_dx *= scale
                         new_dy *= scale
 
                     tgt = (com_world[0] + new_dx, com_world[1] + new_dy)
-                    self.ui_state.push_target = tgt
+                    ui.push_target = tgt
 
                     # Update preview geometry
-                    self.ui_state.push_preview = pattern_motion.build_push_preview(
+                    ui.push_preview = pattern_motion.cached_push_preview(
                         pattern,
                         anchor,
                         tgt,
-                        self.ui_state.push_rotation,
+                        ui.push_rotation,
                         max_range,
                     )
 
@@ -1187,7 +1222,7 @@ class DungeonScene(Scene):
                     ty = int(round(tgt[1]))
                     if game.world.in_bounds(tx, ty):
                         t.cursor_tile = (tx, ty)
-                        self.ui_state.target_cursor = (tx, ty)
+                        ui.target_cursor = (tx, ty)
 
                 # Always swallow movement while in push-mode targeting
                 return
@@ -1196,14 +1231,9 @@ class DungeonScene(Scene):
         # ------------------------------------------------------------
         # Look targeting mode (tile-based inspect cursor)
         # ------------------------------------------------------------
-        if in_look_mode and t:
+        if in_look_mode:
             if kind == "move" and vec is not None:
-                tx, ty = t.cursor_tile or game.actors[game.player_id].pos
-                dx, dy = vec
-                nt = (tx + dx, ty + dy)
-                if game.world.in_bounds(*nt):
-                    t.cursor_tile = nt
-                    self.ui_state.target_cursor = nt
+                self._step_cursor(game, t, vec)
                 # Swallow movement so the player never walks in look mode.
                 return
 
@@ -1212,468 +1242,574 @@ class DungeonScene(Scene):
                 return
 
         # ------------------------------------------------------------
-        # 5) Ability bar: page cycling + hotkeys + quick 'f'
+        # 5+) Everything else: one hashed lookup instead of an if/elif chain.
+        #     Unknown kinds are currently ignored.
         # ------------------------------------------------------------
+        handler = self._KIND_HANDLERS.get(kind)
+        if handler is not None:
+            handler(self, ctx)
 
-        def _page_bar(bar, forward: bool) -> None:
-            """Cycle ability bar page and snap selection to first slot on that page."""
-            if forward:
-                bar.next_page()
-            else:
-                bar.prev_page()
-            start = bar.page * bar.page_size
-            if 0 <= start < len(bar.order):
-                bar.selected_index = start
-                act = bar.action_at_index(start)
-                if act:
-                    bar.active_action = act
-
-        # Page cycling: PgUp/PgDn/Tab switch ability bar pages
-        if kind == "ability_page_prev":
-            _page_bar(bar, forward=False)
+    # ------------------------------------------------------------------ #
+    # Command helpers (modal guards + shared UI plumbing)
+    # ------------------------------------------------------------------ #
+    def _set_ui(self, renderer, attr: str, value) -> None:
+        """Set a ui_state field, mirroring it onto the renderer for compatibility."""
+        setattr(self.ui_state, attr, value)
+        if renderer is not None and hasattr(renderer, attr):
+            setattr(renderer, attr, value)
+
+    @staticmethod
+    def _push_subject(game: Game):
+        """(pattern, anchor) that push_pattern would move, or (None, None) if there is none."""
+        lvl = game._level()
+        pattern = lvl.pattern
+        anchor = lvl.pattern_anchor
+        if pattern and anchor and pattern.vertices:
+            return pattern, anchor
+        return None, None
+
+    @staticmethod
+    def _any_rect_hit(rects, mx: int, my: int) -> bool:
+        """collidepoint() over a short rect list, compared inline."""
+        for r in rects:
+            x, y, w, h = r
+            if x <= mx < x + w and y <= my < y + h:
+                return True
+        return False
+
+    @staticmethod
+    def _page_bar(bar, forward: bool) -> None:
+        """Cycle ability bar page and snap selection to first slot on that page."""
+        if forward:
+            bar.next_page()
+        else:
+            bar.prev_page()
+        start = bar.page * bar.page_size
+        if 0 <= start < len(bar.order):
+            bar.selected_index = start
+            act = bar.action_at_index(start)
+            if act:
+                bar.active_action = act
+
+    def _handle_reorder_command(self, game: Game, bar, kind: str, vec) -> None:
+        """Ability reorder overlay: swallows every command while open."""
+        if kind == "escape":
+            game.ability_reorder_open = False
+            return
+        if kind == "confirm":
+            game.ability_reorder_open = False
+            # keep active action aligned with selected item
+            sel_act = bar.action_at_index(bar.selected_index)
+            if sel_act:
+                bar.set_active(sel_act)
+            return
+        if kind == "move" and vec is not None:
+            dx, dy = vec
+            if dy:
+                bar.move_selection(dy)
+            if dx:
+                bar.move_selected_item(dx)
+            # Both calls already re-page to keep the selection in view.
             return
 
+        if kind == "ability_page_prev":
+            bar.prev_page()
+            # Snap selection to first slot on the new page
+            bar.selected_index = bar.page * bar.page_size
+            return
         if kind == "ability_page_next":
-            _page_bar(bar, forward=True)
+            bar.next_page()
+            bar.selected_index = bar.page * bar.page_size
             return
+        # ignore other commands while reorder UI is active
 
-        if kind == "ability_hotkey" and cmd.hotkey is not None:
-            hk = cmd.hotkey
-            vis = bar.visible_abilities()
+    def _handle_config_command(self, game: Game, renderer, key: int | None) -> None:
+        """Config overlay: arrows pick/adjust params, Enter/Space closes."""
+        params = game.param_view(self.ui_state.config_action)
 
-            # Dynamic page-local hotkeys: 1..N for the current page.
-            for idx, ability in enumerate(vis):
-                # Keep the model's hotkey in sync with row number, so
-                # the renderer's labels match this logic.
-                if hasattr(ability, "hotkey"):
-                    ability.hotkey = idx + 1
-
-                if idx + 1 == hk:
-                    bar.set_active(ability.action)
-                    self._begin_action_from_def(game, ability)
-                    return
+        if key in _K_CONFIRM_KEYS:
+            self._set_ui(renderer, "config_open", False)
             return
 
-        # ------------------------------------------------------------
-        # 6 1/2) Mouse input (click / move / wheel)
-        # ------------------------------------------------------------
+        if key == _K_UP:
+            self._set_ui(
+                renderer,
+                "config_selection",
+                (self.ui_state.config_selection - 1) % max(1, len(params)),
+            )
+            return
 
-        # Mouse hover: update tile/vertex cursor & aim preview.
-        if kind == "mouse_move" and cmd.mouse_pos is not None:
-            self._update_hover_from_mouse(
-                game,
+        if key == _K_DOWN:
+            self._set_ui(
                 renderer,
-                renderer._to_surface(cmd.mouse_pos),
+                "config_selection",
+                (self.ui_state.config_selection + 1) % max(1, len(params)),
             )
             return
 
-        # Mouse wheel controls zoom or activate_all radius.
-        if kind == "mouse_wheel":
-            if cmd.wheel_y:
-                # If hovering over log panel, scroll log instead of zoom.
-                sx, sy = renderer._to_surface(pygame.mouse.get_pos())
-                log_x0 = renderer.width - renderer.log_panel_width
-                log_y0 = renderer.top_bar_height
-                log_y1 = renderer.height - renderer.ability_bar_height
-                if sx >= log_x0 and log_y0 <= sy < log_y1:
-                    try:
-                        renderer.scroll_log(game, delta_lines=cmd.wheel_y)
-                    except Exception:
-                        pass
-                    return
-                if push_mode:
-                    delta_deg = 15 if cmd.wheel_y > 0 else -15
-                    ui.push_rotation = (ui.push_rotation + delta_deg) % 360
-                    if ui.push_target and t and t.constraints:
-                        lvl = game._level()
-                        pattern = getattr(lvl, "pattern", None)
-                        anchor = getattr(lvl, "pattern_anchor", None)
-                        max_range = getattr(t.constraints, "max_range", 5.0)
-                        if pattern and anchor and pattern.vertices:
-                            ui.push_preview = pattern_motion.build_push_preview(
-                                pattern,
-                                anchor,
-                                ui.push_target,
-                                ui.push_rotation,
-                                max_range,
-                            )
-                else:
-                    active_name = bar.active_action
-                    spec = None
-                    if active_name:
-                        try:
-                            action_def = get_action(active_name)
-                            spec = getattr(action_def, "targeting", None)
-                        except KeyError:
-                            spec = None
-
-                    # Only adjust radius with the wheel when actively aiming an action that has a radius param.
-                    if (
-                        spec
-                        and spec.radius_param
-                        and in_target_mode
-                        and t
-                        and getattr(t, "action", None) == active_name
-                    ):
-                        delta = 1 if cmd.wheel_y > 0 else -1
-                        changed, msg = game.adjust_param(
-                            active_name,
-                            spec.radius_param,
-                            delta,
-                        )
-                        if not changed and delta > 0 and msg:
-                            renderer._set_flash(msg)
-                        self._refresh_aim_prediction(game)
-                    else:
-                        renderer._change_zoom(
-                            cmd.wheel_y,
-                            renderer._to_surface(pygame.mouse.get_pos()),
-                        )
+        if key in _K_LEFT_RIGHT:
+            if params:
+                param_key = params[self.ui_state.config_selection]["key"]
+                delta = 1 if key == _K_RIGHT else -1
+                changed, msg = game.adjust_param(
+                    self.ui_state.config_action,
+                    param_key,
+                    delta,
+                )
+                # msg is available if you want to surface it later
             return
 
-        if kind == "toggle_door":
-            level = game._level()
-            player = game.actors[game.player_id]
-            px, py = player.pos
-            # Check current + cardinal neighbors for doors.
-            offsets = [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
-            doors: list[tuple[tuple[int, int], object]] = []
-            for dx, dy in offsets:
-                tx, ty = px + dx, py + dy
-                for ent in game._all_entities(level):
-                    if ent.pos == (tx, ty) and getattr(ent, "tags", {}).get("door"):
-                        doors.append(((dx, dy), ent))
-                        break
-
-            if not doors:
-                game.log.add("No door nearby.")
-                self._pending_door_toggle = None
-                return
+    # ------------------------------------------------------------------ #
+    # Per-kind command handlers (routed via _GLOBAL_KIND_HANDLERS /
+    # _KIND_HANDLERS; each receives the per-command _CommandContext)
+    # ------------------------------------------------------------------ #
+    def _on_escape(self, ctx: "_CommandContext") -> None:
+        # First: cancel unified target mode if active.
+        if ctx.in_target_mode:
+            self.cancel_target_mode(ctx.game)
+            return
 
-            if len(doors) == 1:
-                (_, ent) = doors[0]
-                game._toggle_door(ent, level, notify=True)
-                game._advance_time(level, 5)
-                self._pending_door_toggle = None
-                return
+        # Next: close config overlay if open.
+        if self.ui_state.config_open:
+            self._set_ui(ctx.renderer, "config_open", False)
+            return
 
-            # Multiple doors: ask for direction and store candidates.
-            self._pending_door_toggle = {offset: ent for offset, ent in doors}
-            game.log.add("Multiple doors nearby. Press a direction to choose.")
+        # Otherwise: normal ESC in the dungeon → request pause.
+        renderer = ctx.renderer
+        renderer.pause_requested = True
+        renderer.quit_requested = True
+
+    def _on_open_abilities(self, ctx: "_CommandContext") -> None:
+        bar = ctx.bar
+        ctx.game.ability_reorder_open = True
+        # select current active ability if possible
+        if bar.active_action and bar.active_action in bar.order:
+            bar.selected_index = bar.order.index(bar.active_action)
+            bar.page = bar.selected_index // bar.page_size
+
+    # ------------------------------------------------------------
+    # 5) Ability bar: page cycling + hotkeys
+    # ------------------------------------------------------------
+    def _on_ability_page_prev(self, ctx: "_CommandContext") -> None:
+        self._page_bar(ctx.bar, forward=False)
+
+    def _on_ability_page_next(self, ctx: "_CommandContext") -> None:
+        self._page_bar(ctx.bar, forward=True)
+
+    def _on_ability_hotkey(self, ctx: "_CommandContext") -> None:
+        hk = ctx.cmd.hotkey
+        if hk is None:
             return
+        bar = ctx.bar
+
+        # Dynamic page-local hotkeys: 1..N for the current page. The renderer
+        # renumbers ability.hotkey the same way every frame for the labels.
+        ability = bar.ability_for_hotkey(hk)
+        if ability is not None:
+            bar.set_active(ability.action)
+            self._begin_action_from_def(ctx.game, ability)
+
+    # ------------------------------------------------------------
+    # 6 1/2) Mouse input (click / move / wheel)
+    # ------------------------------------------------------------
+    def _flush_mouse_move(self, game: Game, renderer) -> None:
+        """Update tile/vertex cursor & aim preview from the latest pending mouse position."""
+        pos = self._pending_mouse_pos
+        if pos is None:
+            return
+        self._pending_mouse_pos = None
+        self._update_hover_from_mouse(game, renderer, renderer._to_surface(pos))
 
-        # Mouse click drives target confirm, ability bar, config, placement, and click-to-move.
-        if kind == "mouse_click" and cmd.mouse_pos is not None and cmd.mouse_button == 1:
-            # If we’re in target mode, treat click as confirm after updating hover.
-            if in_target_mode:
-                self._update_hover_from_mouse(
-                    game,
-                    renderer,
-                    renderer._to_surface(cmd.mouse_pos),
+    def _on_mouse_wheel(self, ctx: "_CommandContext") -> None:
+        # Mouse wheel controls zoom or activate_all radius.
+        cmd = ctx.cmd
+        if not cmd.wheel_y:
+            return
+        game = ctx.game
+        renderer = ctx.renderer
+        ui = self.ui_state
+        t = ctx.t
+
+        # If hovering over log panel, scroll log instead of zoom.
+        mouse_surf = renderer._to_surface(pygame.mouse.get_pos())
+        sx, sy = mouse_surf
+        log_x0 = renderer.width - renderer.log_panel_width
+        log_y0 = renderer.top_bar_height
+        log_y1 = renderer.height - renderer.ability_bar_height
+        if sx >= log_x0 and log_y0 <= sy < log_y1:
+            try:
+                renderer.scroll_log(game, delta_lines=cmd.wheel_y)
+            except Exception:
+                pass
+            return
+        if ctx.push_mode:
+            delta_deg = 15 if cmd.wheel_y > 0 else -15
+            ui.push_rotation = (ui.push_rotation + delta_deg) % 360
+            if ui.push_target and ctx.push_pattern is not None:
+                ui.push_preview = pattern_motion.cached_push_preview(
+                    ctx.push_pattern,
+                    ctx.push_anchor,
+                    ui.push_target,
+                    ui.push_rotation,
+                    t.constraints.max_range,
                 )
-                if t and t.kind == "look":
-                    self._confirm_look(game, renderer, manager)
-                else:
-                    self.confirm_target(game)
-                return
-
-            mx, my = renderer._to_surface(cmd.mouse_pos)
-
-            # Ability bar page arrows.
-            bar_view = getattr(renderer, "ability_bar_view", None)
-            if bar_view is not None:
-                prev_rects = []
-                next_rects = []
-                # Support multiple arrow hitboxes (above/below on both sides).
-                if hasattr(bar_view, "page_prev_rects"):
-                    prev_rects.extend(bar_view.page_prev_rects)
-                if hasattr(bar_view, "page_next_rects"):
-                    next_rects.extend(bar_view.page_next_rects)
-                if bar_view.page_prev_rect:
-                    prev_rects.append(bar_view.page_prev_rect)
-                if bar_view.page_next_rect:
-                    next_rects.append(bar_view.page_next_rect)
-
-                if any(r.collidepoint(mx, my) for r in prev_rects):
-                    _page_bar(bar, forward=False)
-                    return
-                if any(r.collidepoint(mx, my) for r in next_rects):
-                    _page_bar(bar, forward=True)
-                    return
+            return
 
-            # Open ability reorder manager.
-            if (
-                bar_view is not None
-                and bar_view.abilities_button_rect
-                and bar_view.abilities_button_rect.collidepoint(mx, my)
-            ):
-                game.ability_reorder_open = True
-                if bar.active_action and bar.active_action in bar.order:
-                    bar.selected_index = bar.order.index(bar.active_action)
-                    bar.page = bar.selected_index // bar.page_size if bar.page_size else 0
-                return
+        active_name = ctx.bar.active_action
+        spec = action_targeting(active_name) if active_name else None
 
-            # Ability bar buttons: rects are attached to Ability instances by the AbilityBarRenderer.
-            for ability in bar.visible_abilities():
-                rect = getattr(ability, "rect", None)
-                if rect and rect.collidepoint(mx, my):
-                    bar.set_active(ability.action)
-
-                    plus_rect = getattr(ability, "plus_rect", None)
-                    minus_rect = getattr(ability, "minus_rect", None)
-                    gear_rect = getattr(ability, "gear_rect", None)
-
-                    # +/- param tweak using sub-button metadata.
-                    if plus_rect and plus_rect.collidepoint(mx, my):
-                        from edgecaster.systems.actions import action_sub_buttons
-
-                        for meta in action_sub_buttons(ability.action):
-                            if (
-                                meta.kind == "param_delta"
-                                and (meta.delta or 0) > 0
-                                and meta.param_key
-                            ):
-                                changed, msg = game.adjust_param(
-                                    ability.action,
-                                    meta.param_key,
-                                    meta.delta,
-                                )
-                                if not changed and msg:
-                                    renderer._set_flash(msg)
-                                self._refresh_aim_prediction(game)
-                                break
-                        return
-
-                    if minus_rect and minus_rect.collidepoint(mx, my):
-                        from edgecaster.systems.actions import action_sub_buttons
-
-                        for meta in action_sub_buttons(ability.action):
-                            if (
-                                meta.kind == "param_delta"
-                                and (meta.delta or 0) < 0
-                                and meta.param_key
-                            ):
-                                changed, _ = game.adjust_param(
-                                    ability.action,
-                                    meta.param_key,
-                                    meta.delta,
-                                )
-                                self._refresh_aim_prediction(game)
-                                break
-                        return
-
-                    # Gear opens config overlay (still generic).
-                    if gear_rect and gear_rect.collidepoint(mx, my):
-                        _set_ui("config_open", True)
-                        _set_ui("config_action", ability.action)
-                        _set_ui("config_selection", 0)
-                        return
-
-                    # Main ability click: delegate to Action metadata.
-                    self._begin_action_from_def(game, ability)
-                    return
+        # Only adjust radius with the wheel when actively aiming an action that has a radius param.
+        if (
+            spec
+            and spec.radius_param
+            and ctx.in_target_mode
+            and t
+            and t.action == active_name
+        ):
+            delta = 1 if cmd.wheel_y > 0 else -1
+            changed, msg = game.adjust_param(
+                active_name,
+                spec.radius_param,
+                delta,
+            )
+            if not changed and delta > 0 and msg:
+                renderer._set_flash(msg)
+            self._refresh_aim_prediction(game)
+        else:
+            renderer._change_zoom(cmd.wheel_y, mouse_surf)
+
+    def _on_toggle_door(self, ctx: "_CommandContext") -> None:
+        game = ctx.game
+        level = game._level()
+        player = game.actors[game.player_id]
+        px, py = player.pos
+        # Check current + cardinal neighbors for doors.
+        offsets = [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
+        doors: list[tuple[tuple[int, int], object]] = []
+        for dx, dy in offsets:
+            tx, ty = px + dx, py + dy
+            for ent in game._all_entities(level):
+                if ent.pos == (tx, ty) and getattr(ent, "tags", {}).get("door"):
+                    doors.append(((dx, dy), ent))
+                    break
+
+        if not doors:
+            game.log.add("No door nearby.")
+            self._pending_door_toggle = None
+            return
 
-            # Map / world clicks.
-            tx = int((mx - renderer.origin_x) // renderer.tile)
-            ty = int((my - renderer.origin_y) // renderer.tile)
-            if not game.world.in_bounds(tx, ty):
-                return
+        if len(doors) == 1:
+            (_, ent) = doors[0]
+            game._toggle_door(ent, level, notify=True)
+            game._advance_time(level, 5)
+            self._pending_door_toggle = None
+            return
 
-            # Terminus placement via click (legacy).
-            if getattr(game, "awaiting_terminus", False):
-                _set_ui("target_cursor", (tx, ty))
-                game.try_place_terminus((tx, ty))
-                return
+        # Multiple doors: ask for direction and store candidates.
+        self._pending_door_toggle = {offset: ent for offset, ent in doors}
+        game.log.add("Multiple doors nearby. Press a direction to choose.")
 
-            # Default: click-to-move / stairs / wait.
-            player = game.actors[game.player_id]
-            px, py = player.pos
-            dx = tx - px
-            dy = ty - py
-
-            if tx == px and ty == py:
-                # Clicked on the player: use stairs if present, otherwise wait.
-                tile = game.world.get_tile(tx, ty) if hasattr(game, "world") else None
-                glyph = getattr(tile, "glyph", None) if tile is not None else None
-
-                if glyph == ">":
-                    # Stairs down
-                    if hasattr(game, "use_stairs_down"):
-                        game.use_stairs_down()
-                elif glyph == "<":
-                    # Stairs up
-                    if hasattr(game, "use_stairs_up"):
-                        game.use_stairs_up()
-                else:
-                    # No stairs here: treat click-on-self as a wait.
-                    if hasattr(game, "queue_player_wait"):
-                        game.queue_player_wait()
-            elif max(abs(dx), abs(dy)) == 1:
-                # Clicked on an adjacent tile: move there.
-                game.queue_player_move((int(dx), int(dy)))
+    def _on_mouse_click(self, ctx: "_CommandContext") -> None:
+        # Mouse click drives target confirm, ability bar, config, placement, and click-to-move.
+        cmd = ctx.cmd
+        if cmd.mouse_pos is None or cmd.mouse_button != 1:
+            return
+        game = ctx.game
+        renderer = ctx.renderer
+        bar = ctx.bar
+        t = ctx.t
+        mouse_surf = renderer._to_surface(cmd.mouse_pos)
+
+        # If we’re in target mode, treat click as confirm after updating hover.
+        if ctx.in_target_mode:
+            self._update_hover_from_mouse(game, renderer, mouse_surf)
+            if t and t.kind == "look":
+                self._confirm_look(game, renderer, ctx.manager)
+            else:
+                self.confirm_target(game)
             return
 
+        mx, my = mouse_surf
 
-        # ------------------------------------------------------------
-        # 6) High-level game actions (non-movement)
-        # ------------------------------------------------------------
+        # Ability bar page arrows.
+        bar_view = getattr(renderer, "ability_bar_view", None)
+        if bar_view is not None:
+            # Support multiple arrow hitboxes (above/below on both sides). The
+            # renderer builds these lists once per layout, < / > included.
+            prev_rects, next_rects = _get_arrow_rects(bar_view)
 
-        if kind == "examine":
-            if not in_aim_mode:
-                if hasattr(game, "describe_current_tile"):
-                    game.describe_current_tile()
-            return
+            if self._any_rect_hit(prev_rects, mx, my):
+                self._page_bar(bar, forward=False)
+                return
+            if self._any_rect_hit(next_rects, mx, my):
+                self._page_bar(bar, forward=True)
+                return
 
-        if kind == "look_action":
-            # Trigger the 'look' Action via the central Action entry point.
-            # This will read the Action's TargetingSpec (kind="look", mode="look")
-            # and enter look-style TargetMode.
-            self._begin_action_from_def(game, "look")
+        # Open ability reorder manager.
+        if (
+            bar_view is not None
+            and bar_view.abilities_button_rect
+            and bar_view.abilities_button_rect.collidepoint(mx, my)
+        ):
+            game.ability_reorder_open = True
+            if bar.active_action and bar.active_action in bar.order:
+                bar.selected_index = bar.order.index(bar.active_action)
+                bar.page = bar.selected_index // bar.page_size if bar.page_size else 0
             return
 
-        if kind == "pickup":
-            if not in_aim_mode:
-                if hasattr(game, "player_pick_up"):
-                    game.player_pick_up()
-            return
+        # Ability bar buttons: the AbilityBarRenderer keeps a flat hit index of
+        # the slots it drew (sub-buttons ahead of their slot), so one pass
+        # resolves the click. Skip it for clicks above the bar, or when the
+        # bar model has moved on since that frame was drawn.
+        bar_rect = bar_view.bar_rect if bar_view is not None else None
+        if (
+            bar_rect is not None
+            and my >= bar_rect.top
+            and bar_view.hit_abilities is bar.abilities
+            and bar_view.hit_page == bar.page
+        ):
+            for rect, ability, role in bar_view.hit_rects:
+                if not rect.collidepoint(mx, my):
+                    continue
+                bar.set_active(ability.action)
+
+                # +/- param tweak using sub-button metadata.
+                if role == "plus" or role == "minus":
+                    sign = 1 if role == "plus" else -1
+                    for meta in action_sub_buttons(ability.action):
+                        if (
+                            meta.kind == "param_delta"
+                            and (meta.delta or 0) * sign > 0
+                            and meta.param_key
+                        ):
+                            changed, msg = game.adjust_param(
+                                ability.action,
+                                meta.param_key,
+                                meta.delta,
+                            )
+                            if sign > 0 and not changed and msg:
+                                renderer._set_flash(msg)
+                            self._refresh_aim_prediction(game)
+                            break
+                    return
 
-        if kind == "possess_nearest":
-            level = game._level()
-            player = level.actors.get(game.player_id)
-            if player is not None:
-                px, py = player.pos
-                best_id = None
-                best_d2 = 1e18
-                for actor in level.actors.values():
-                    if not actor.alive or actor.id == game.player_id:
-                        continue
-                    ax, ay = actor.pos
-                    dx = ax - px
-                    dy = ay - py
-                    d2 = dx * dx + dy * dy
-                    if d2 < best_d2:
-                        best_d2 = d2
-                        best_id = actor.id
-                if best_id is not None:
-                    game.possess_actor(best_id)
-            return
+                # Gear opens config overlay (still generic).
+                if role == "gear":
+                    self._set_ui(renderer, "config_open", True)
+                    self._set_ui(renderer, "config_action", ability.action)
+                    self._set_ui(renderer, "config_selection", 0)
+                    return
+
+                # Main ability click: delegate to Action metadata.
+                self._begin_action_from_def(game, ability)
+                return
 
-        if kind == "open_inventory":
-            if not in_aim_mode:
-                setattr(game, "inventory_requested", True)
-                renderer.quit_requested = True
+        # Map / world clicks.
+        tx = int((mx - renderer.origin_x) // renderer.tile)
+        ty = int((my - renderer.origin_y) // renderer.tile)
+        if not game.world.in_bounds(tx, ty):
             return
 
-        if kind == "yawp":
-            # Defer to the central Action definition for yawp.
-            # This lets _debug_yawp in actions.py handle both the log
-            # message and the visual rotation test.
-            trigger_ability_effect(game, "yawp")
+        # Terminus placement via click (legacy).
+        if game.awaiting_terminus:
+            self._set_ui(renderer, "target_cursor", (tx, ty))
+            game.try_place_terminus((tx, ty))
             return
 
+        # Default: click-to-move / stairs / wait.
+        player = game.actors[game.player_id]
+        px, py = player.pos
+        dx = tx - px
+        dy = ty - py
 
-        if kind == "wait":
-            if hasattr(game, "queue_player_wait"):
-                game.queue_player_wait()
-            return
+        if tx == px and ty == py:
+            # Clicked on the player: use stairs if present, otherwise wait.
+            # (tx, ty) was bounds-checked above, so the tile always exists.
+            glyph = game.world.tiles[ty][tx].glyph
 
-        if kind == "stairs_down":
-            if hasattr(game, "use_stairs_down"):
+            if glyph == ">":
                 game.use_stairs_down()
-            return
-
-        if kind == "stairs_up_or_map":
-            tile = game.world.get_tile(*game.actors[game.player_id].pos)
-            zone = getattr(game, "zone_coord", getattr(game, "zone", (0, 0, game.level_index)))
-            depth = zone[2] if len(zone) > 2 else getattr(game, "level_index", 0)
-            if depth == 0 and (not tile or tile.glyph != "<"):
-                game.map_requested = True
-                renderer.quit_requested = True
-                return
-            if hasattr(game, "use_stairs_up"):
+            elif glyph == "<":
                 game.use_stairs_up()
-            return
+            else:
+                # No stairs here: treat click-on-self as a wait.
+                game.queue_player_wait()
+        elif max(abs(dx), abs(dy)) == 1:
+            # Clicked on an adjacent tile: move there.
+            game.queue_player_move((int(dx), int(dy)))
+
+    # ------------------------------------------------------------
+    # 6) High-level game actions (non-movement)
+    # ------------------------------------------------------------
+    def _on_examine(self, ctx: "_CommandContext") -> None:
+        game = ctx.game
+        if not ctx.in_aim_mode:
+            if hasattr(game, "describe_current_tile"):
+                game.describe_current_tile()
+
+    def _on_look_action(self, ctx: "_CommandContext") -> None:
+        # Trigger the 'look' Action via the central Action entry point.
+        # This will read the Action's TargetingSpec (kind="look", mode="look")
+        # and enter look-style TargetMode.
+        self._begin_action_from_def(ctx.game, "look")
+
+    def _on_pickup(self, ctx: "_CommandContext") -> None:
+        game = ctx.game
+        if not ctx.in_aim_mode:
+            if hasattr(game, "player_pick_up"):
+                game.player_pick_up()
+
+    def _on_possess_nearest(self, ctx: "_CommandContext") -> None:
+        game = ctx.game
+        level = game._level()
+        player = level.actors.get(game.player_id)
+        if player is not None:
+            px, py = player.pos
+            player_id = game.player_id
 
-        if kind == "open_fractal_editor":
-            from .fractal_editor_scene import FractalEditorState
+            def dist2(actor) -> int:
+                ax, ay = actor.pos
+                return (ax - px) * (ax - px) + (ay - py) * (ay - py)
 
-            game.fractal_editor_state = FractalEditorState()  # default rect grid
-            setattr(game, "fractal_editor_requested", True)
-            renderer.quit_requested = True
+            # min() keeps the first closest actor, matching the old manual scan.
+            best = min(
+                (a for a in level.actors.values() if a.alive and a.id != player_id),
+                key=dist2,
+                default=None,
+            )
+            if best is not None:
+                game.possess_actor(best.id)
+
+    def _on_open_inventory(self, ctx: "_CommandContext") -> None:
+        if not ctx.in_aim_mode:
+            setattr(ctx.game, "inventory_requested", True)
+            ctx.renderer.quit_requested = True
+
+    def _on_yawp(self, ctx: "_CommandContext") -> None:
+        # Defer to the central Action definition for yawp.
+        # This lets _debug_yawp in actions.py handle both the log
+        # message and the visual rotation test.
+        trigger_ability_effect(ctx.game, "yawp")
+
+    def _on_wait(self, ctx: "_CommandContext") -> None:
+        game = ctx.game
+        if hasattr(game, "queue_player_wait"):
+            game.queue_player_wait()
+
+    def _on_stairs_down(self, ctx: "_CommandContext") -> None:
+        game = ctx.game
+        if hasattr(game, "use_stairs_down"):
+            game.use_stairs_down()
+
+    def _on_stairs_up_or_map(self, ctx: "_CommandContext") -> None:
+        game = ctx.game
+        tile = game.world.get_tile(*game.actors[game.player_id].pos)
+        depth = game.zone_coord[2]
+        if depth == 0 and (not tile or tile.glyph != "<"):
+            game.map_requested = True
+            ctx.renderer.quit_requested = True
             return
-
-        if kind == "talk":
-            convo = game.talk_start() if hasattr(game, "talk_start") else None
-            if convo:
-                title = convo.get("name", "Conversation") if isinstance(convo, dict) else "Conversation"
-                lines = []
-                if isinstance(convo, dict):
-                    lines = convo.get("lines", [])
-                body = "\n".join(lines) if lines else ""
-                choices = convo.get("choices", ["Continue..."]) if isinstance(convo, dict) else ["Continue..."]
-                npc_id = convo.get("npc_id") if isinstance(convo, dict) else None
-
-                def on_choice(idx: int, mgr) -> None:
-                    choice = choices[idx] if 0 <= idx < len(choices) else None
-                    if hasattr(game, "talk_complete"):
-                        summary = game.talk_complete(npc_id, choice)
-                        if summary:
-                            game.log.add(summary)
-
-                manager.push_scene(
-                    UrgentMessageScene(
-                        game,
-                        body or title,
-                        title=title,
-                        choices=choices,
-                        on_choice=on_choice,
-                    )
+        if hasattr(game, "use_stairs_up"):
+            game.use_stairs_up()
+
+    def _on_open_fractal_editor(self, ctx: "_CommandContext") -> None:
+        from .fractal_editor_scene import FractalEditorState
+
+        game = ctx.game
+        game.fractal_editor_state = FractalEditorState()  # default rect grid
+        setattr(game, "fractal_editor_requested", True)
+        ctx.renderer.quit_requested = True
+
+    def _on_talk(self, ctx: "_CommandContext") -> None:
+        game = ctx.game
+        convo = game.talk_start() if hasattr(game, "talk_start") else None
+        if convo:
+            title = convo.get("name", "Conversation") if isinstance(convo, dict) else "Conversation"
+            lines = []
+            if isinstance(convo, dict):
+                lines = convo.get("lines", [])
+            body = "\n".join(lines) if lines else ""
+            choices = convo.get("choices", ["Continue..."]) if isinstance(convo, dict) else ["Continue..."]
+            npc_id = convo.get("npc_id") if isinstance(convo, dict) else None
+
+            def on_choice(idx: int, mgr) -> None:
+                choice = choices[idx] if 0 <= idx < len(choices) else None
+                if hasattr(game, "talk_complete"):
+                    summary = game.talk_complete(npc_id, choice)
+                    if summary:
+                        game.log.add(summary)
+
+            ctx.manager.push_scene(
+                UrgentMessageScene(
+                    game,
+                    body or title,
+                    title=title,
+                    choices=choices,
+                    on_choice=on_choice,
                 )
-            else:
-                game.log.add("No one nearby to talk to.")
+            )
+        else:
+            game.log.add("No one nearby to talk to.")
+
+    # ------------------------------------------------------------
+    # 7) Movement (no special modes active)
+    # ------------------------------------------------------------
+    def _on_move(self, ctx: "_CommandContext") -> None:
+        vec = ctx.cmd.vector
+        if vec is None:
             return
-
-        # ------------------------------------------------------------
-        # 7) Movement (no special modes active)
-        # ------------------------------------------------------------
-
-        if kind == "move" and vec is not None:
-            if self._pending_door_toggle:
-                dx, dy = vec
-                ent = self._pending_door_toggle.get((dx, dy))
-                if ent:
-                    game._toggle_door(ent, game._level(), notify=True)
-                    game._advance_time(game._level(), 5)
-                else:
-                    game.log.add("No door in that direction.")
-                self._pending_door_toggle = None
-                return
-            if hasattr(game, "queue_player_move"):
-                game.queue_player_move(vec)
+        game = ctx.game
+        if self._pending_door_toggle:
+            dx, dy = vec
+            ent = self._pending_door_toggle.get((dx, dy))
+            if ent:
+                game._toggle_door(ent, game._level(), notify=True)
+                game._advance_time(game._level(), 5)
+            else:
+                game.log.add("No door in that direction.")
+            self._pending_door_toggle = None
             return
-
-        # ------------------------------------------------------------
-        # 8) Default confirm: trigger current ability
-        # ------------------------------------------------------------
-
-        if kind == "confirm":
-            vis = bar.visible_abilities()
-            if not vis:
-                return
-
-            ability = None
-            if bar.active_action:
-                for ab in vis:
-                    if ab.action == bar.active_action:
-                        ability = ab
-                        break
-            if ability is None:
-                ability = vis[0]
-
-            self._begin_action_from_def(game, ability)
+        if hasattr(game, "queue_player_move"):
+            game.queue_player_move(vec)
+
+    # ------------------------------------------------------------
+    # 8) Default confirm: trigger current ability
+    # ------------------------------------------------------------
+    def _on_confirm(self, ctx: "_CommandContext") -> None:
+        ability = ctx.bar.confirm_ability()
+        if ability is None:
             return
 
-        # Any other kinds are currently ignored.
+        self._begin_action_from_def(ctx.game, ability)
+
+    # Checked before the config overlay / target-mode guards.
+    _GLOBAL_KIND_HANDLERS = {
+        "escape": _on_escape,
+        "open_abilities": _on_open_abilities,
+    }
+
+    # Checked after the modal guards; unknown kinds are ignored.
+    _KIND_HANDLERS = {
+        "ability_page_prev": _on_ability_page_prev,
+        "ability_page_next": _on_ability_page_next,
+        "ability_hotkey": _on_ability_hotkey,
+        "mouse_wheel": _on_mouse_wheel,
+        "toggle_door": _on_toggle_door,
+        "mouse_click": _on_mouse_click,
+        "examine": _on_examine,
+        "look_action": _on_look_action,
+        "pickup": _on_pickup,
+        "possess_nearest": _on_possess_nearest,
+        "open_inventory": _on_open_inventory,
+        "yawp": _on_yawp,
+        "wait": _on_wait,
+        "stairs_down": _on_stairs_down,
+        "stairs_up_or_map": _on_stairs_up_or_map,
+        "open_fractal_editor": _on_open_fractal_editor,
+        "talk": _on_talk,
+        "move": _on_move,
+        "confirm": _on_confirm,
+    }
 
     # ------------------------------------------------------------------ #
     # Central ability entry point
@@ -1686,33 +1822,35 @@ class DungeonScene(Scene):
         - If the action is non-targeted, fires immediately.
         - If the action has targeting metadata, enters unified TargetMode.
         """
-        action_name = getattr(ability, "action", ability)
-        try:
-            action_def = get_action(action_name)
-        except KeyError:
+        # Callers pass either an Ability or a bare action name.
+        action_name = ability if type(ability) is str else ability.action
+        action_def = find_action(action_name)
+        if action_def is None:
             trigger_ability_effect(game, action_name)
             return
 
-        spec = getattr(action_def, "targeting", None)
+        spec = action_def.targeting
+        kind = spec.kind if spec is not None else None
 
         # No targeting metadata: fire immediately.
-        if not spec or not spec.kind:
-            self.ui_state.aim_action = None
-            self._refresh_aim_prediction(game)
+        if not kind:
+            ui = self.ui_state
+            # With no aim action there is no prediction to clear (every path
+            # that drops aim_action also drops aim_prediction).
+            if ui.aim_action is not None:
+                ui.aim_action = None
+                self._refresh_aim_prediction(game)
             trigger_ability_effect(game, action_name)
             return
 
-        constraints = TargetConstraints(
-            max_range=spec.max_range,
-            neighbor_depth_param=spec.neighbor_depth_param,
-            use_param_radius=getattr(spec, "radius_param", spec.use_param_radius if hasattr(spec, "use_param_radius") else None),
-        )
+        mode, constraints = _spec_target_args(spec)
 
         # Enter unified TargetMode for this action.
         self.begin_target_mode(
             game,
-            action=action_name,
-            kind=spec.kind,           # "tile" or "vertex" or "look" or "position"
-            mode=spec.mode,           # "terminus", "aim", etc.
-            constraints=constraints,
+            action_name,
+            kind,                     # "tile" or "vertex" or "look" or "position"
+            mode,                     # "terminus", "aim", etc.
+            None,                     # origin actor: the player
+            constraints,
         )
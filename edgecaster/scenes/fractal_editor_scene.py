@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import math
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Deque, List, Optional, Tuple
 
 import pygame
 
@@ -12,6 +13,8 @@ from .base import Scene
 Color = Tuple[int, int, int]
 Vec2 = Tuple[float, float]
 
+UNDO_LIMIT = 64
+
 
 YELLOW = (240, 210, 80)
 PURPLE = (150, 90, 190)
@@ -19,6 +22,39 @@ WHITE = (230, 230, 240)
 RED = (240, 120, 120)
 CYAN = (120, 200, 240)
 
+_SQRT3 = math.sqrt(3.0)
+_HALF_SQRT3 = _SQRT3 / 2.0
+
+# Grid steps around a snapped point that a vertex hit can come from.
+_RECT_NEIGHBORHOOD = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+_HEX_NEIGHBORHOOD = [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1), (1, -1), (-1, 1)]
+
+# Unit corner offsets of a pointy-top hex, corner i at 30 + 60*i degrees.
+_HEX_UNIT_CORNERS = [
+    (math.cos(math.radians(30 + 60 * i)), math.sin(math.radians(30 + 60 * i))) for i in range(6)
+]
+
+
+# Hex grid snapping: round fractional axial coordinates to the nearest cell.
+
+
+def _nearest_hex_axial(q: float, r: float) -> Vec2:
+    """Round axial coordinates to the nearest hex center."""
+    y = -q - r
+    rx, ry, rz = round(q), round(y), round(r)
+
+    dx = abs(rx - q)
+    dy = abs(ry - y)
+    dz = abs(rz - r)
+
+    # Fix up the axis with the largest rounding error. Only q and r are
+    # returned, so when that axis is y there is nothing to correct.
+    if dx > dy and dx > dz:
+        return (-ry - rz, rz)
+    if dy > dz:
+        return (rx, rz)
+    return (rx, -rx - ry)
+
 
 @dataclass
 class FractalEditorState:
@@ -79,18 +115,68 @@ class FractalEditorScene(Scene):
         self.selected_edge: Optional[int] = None
         self.current_root: Optional[int] = None  # None uses implicit root at (0,0)
         self.mode: str = "draw"  # draw | delete | flip | edge
-        self.undo_stack: List[Tuple[List[Vec2], List[Tuple[int, int]], Optional[int], str]] = []
+        # Each entry is [vertices, edges, current_root, mode] as they were
+        # before one editor action. The lists are copied lazily by
+        # _undo_touch() the first time the action mutates them; None means
+        # the action left that list alone.
+        self.undo_stack: Deque[list] = deque(maxlen=UNDO_LIMIT)
         self._background: Optional[pygame.Surface] = None
         self._font: Optional[pygame.font.Font] = None
         self._small_font: Optional[pygame.font.Font] = None
         self.margin = 40
         self.cell_size = 0  # computed per render
-        self._hex_min_x: float = 0.0
-        self._hex_min_y: float = 0.0
+        # Grid -> screen affine (ox, oy, axx, axy, ayy), set by _compute_cell_size:
+        # sx = ox + axx*gx + axy*gy, sy = oy + ayy*gy.
+        self._g2s: Optional[Tuple[float, float, float, float, float]] = None
+        # Everything _compute_cell_size reads; it is a no-op while unchanged.
+        self._layout_inputs: Optional[Tuple] = None
+        # Screen position of each vertex; None until needed. Dropped when the
+        # layout changes and by _graph_changed().
+        self._vertex_px: Optional[List[Tuple[int, int]]] = None
+        # Screen endpoints of each edge (see _edge_screen_segments); dropped
+        # with _vertex_px and by _edges_changed().
+        self._edge_px: Optional[List[Tuple[int, int, int, int]]] = None
+        # Gradient sub-segments built from _edge_px (see _edge_strokes).
+        self._edge_strokes_cache: List[List[Tuple[Color, Tuple[int, int], Tuple[int, int]]]] = []
+        self._edge_strokes_src: Optional[List[Tuple[int, int, int, int]]] = None
+        # Screen-cell index over _edge_px for hit-testing (see _edge_buckets).
+        self._edge_buckets_cache: Tuple[int, dict[Tuple[int, int], List[int]]] = (1, {})
+        self._edge_buckets_src: Optional[List[Tuple[int, int, int, int]]] = None
+        # Layout-independent bucket index for _vertex_at_screen; dropped by
+        # _graph_changed().
+        self._vertex_bucket_cache: Optional[dict[Tuple[int, int], List[int]]] = None
+        # Position -> vertex index (see _vertex_index); dropped by _graph_changed().
+        self._pos_to_idx: Optional[dict[Vec2, int]] = None
+        # state.edges as a set (see _edge_set); _add_edge keeps it in sync,
+        # other edge edits drop it via _edges_changed().
+        self._edge_set_cache: Optional[set[Tuple[int, int]]] = None
+        # Per-pixel-alpha panel surface _draw renders into, reused while the
+        # panel size is unchanged.
+        self._overlay: Optional[pygame.Surface] = None
+        # Pre-rendered background + grid layer (see _static_layer), rebuilt when
+        # the panel size or layout changes.
+        self._static_cache: Optional[pygame.Surface] = None
+        self._static_cache_key: Optional[Tuple] = None
+        # x -> vertex color for this state's (fixed) grid bounds; see _color_for_x().
+        self._x_colors: dict[float, Color] = {}
+        # steps -> edge gradient colors; see _edge_ramp().
+        self._edge_ramps: dict[int, List[Color]] = {}
+        # _HEX_UNIT_CORNERS scaled to the cell size they were computed for.
+        self._hex_offsets: List[Tuple[float, float]] = []
+        self._hex_offsets_size = 0
+        # (fill, outline, radius) -> vertex sprite; see _vertex_sprite().
+        self._vertex_sprites: dict[Tuple[Color, Color, int], pygame.Surface] = {}
+        # Rendered label surfaces; see _text().
+        self._text_cache: dict[Tuple[pygame.font.Font, str, Color], pygame.Surface] = {}
+        # (panel.right, rects) from the last _mode_button_rects() call.
+        self._mode_rects_cache: Optional[Tuple[int, List[Tuple[str, str, pygame.Rect]]]] = None
 
         # Status line (e.g. for constraint failures on accept)
         self.status_msg: str = ""
 
+        # Set when the editor overlay needs re-rendering; see run().
+        self._dirty = True
+
     # ------------------------------------------------------------
     # Utility helpers
 
@@ -102,59 +188,58 @@ class FractalEditorScene(Scene):
             int(a[2] + (b[2] - a[2]) * t),
         )
 
+    def _edge_ramp(self, steps: int) -> List[Color]:
+        """Gradient colors for an edge drawn in `steps` segments (index 1..steps)."""
+        ramp = self._edge_ramps.get(steps)
+        if ramp is None:
+            ramp = [self._lerp(YELLOW, PURPLE, s / steps) for s in range(steps + 1)]
+            self._edge_ramps[steps] = ramp
+        return ramp
+
     def _color_for_x(self, x: float) -> Color:
-        denom = max(1e-6, (self.state.grid_x_max - self.state.grid_x_min))
-        t = (x - self.state.grid_x_min) / denom
-        return self._lerp(YELLOW, PURPLE, t)
+        # Vertices sit on a handful of grid columns, so memoize per x.
+        col = self._x_colors.get(x)
+        if col is None:
+            denom = max(1e-6, (self.state.grid_x_max - self.state.grid_x_min))
+            t = (x - self.state.grid_x_min) / denom
+            col = self._x_colors[x] = self._lerp(YELLOW, PURPLE, t)
+        return col
 
     def _grid_to_screen(self, gx: float, gy: float, panel: pygame.Rect) -> Tuple[int, int]:
         if self.cell_size <= 0:
             self._compute_cell_size(panel)
-        if self.state.grid_kind == "hex":
-            size = self.cell_size
-            root_x = panel.left + self.margin
-            root_y = panel.top + self.margin
-            sqrt3 = math.sqrt(3)
-            px = (sqrt3 * gx + (sqrt3 / 2.0) * gy - self._hex_min_x) * size
-            py = ((1.5) * gy - self._hex_min_y) * size
-            return int(root_x + px), int(root_y + py)
-        else:
-            sx = panel.left + self.margin + int((gx - self.state.grid_x_min) * self.cell_size)
-            # invert y for screen
-            sy = panel.top + self.margin + int((self.state.grid_y_max - gy) * self.cell_size)
-            return sx, sy
+        ox, oy, axx, axy, ayy = self._g2s
+        return int(ox + axx * gx + axy * gy), int(oy + ayy * gy)
 
     def _screen_to_grid(self, sx: int, sy: int, panel: pygame.Rect) -> Vec2:
         if self.cell_size <= 0:
             self._compute_cell_size(panel)
-        if self.state.grid_kind == "hex":
-            size = float(self.cell_size)
-            root_x = panel.left + self.margin
-            root_y = panel.top + self.margin
-            sqrt3 = math.sqrt(3)
-            x = (sx - root_x) / size + self._hex_min_x
-            y = (sy - root_y) / size + self._hex_min_y
-            r = y / 1.5
-            q = (x - (sqrt3 / 2.0) * r) / sqrt3
-            return (q, r)
-        else:
-            gx = self.state.grid_x_min + (sx - (panel.left + self.margin)) / float(self.cell_size)
-            gy = self.state.grid_y_max - (sy - (panel.top + self.margin)) / float(self.cell_size)
-            return gx, gy
+        ox, oy, axx, axy, ayy = self._g2s
+        gy = (sy - oy) / ayy
+        gx = (sx - ox - axy * gy) / axx
+        return gx, gy
 
     def _nearest_grid_point(self, gx: float, gy: float) -> Vec2:
         if self.state.grid_kind == "hex":
-            return self._nearest_hex_point(gx, gy)
+            return _nearest_hex_axial(gx, gy)
         # rectangular grid snapping
         return (round(gx), round(gy))
 
     def _compute_cell_size(self, panel: pygame.Rect) -> None:
+        st = self.state
+        inputs = (
+            tuple(panel), self.margin, st.grid_kind,
+            st.grid_x_min, st.grid_x_max, st.grid_y_min, st.grid_y_max,
+        )
+        if inputs == self._layout_inputs and self.cell_size > 0:
+            return
+        self._layout_inputs = inputs
         if self.state.grid_kind == "hex":
             qmin, qmax = self.state.grid_x_min, self.state.grid_x_max
             rmin, rmax = self.state.grid_y_min, self.state.grid_y_max
-            sqrt3 = math.sqrt(3)
+            sqrt3 = _SQRT3
             corners = [(qmin, rmin), (qmin, rmax), (qmax, rmin), (qmax, rmax)]
-            xs = [sqrt3 * q + (sqrt3 / 2.0) * r for q, r in corners]
+            xs = [sqrt3 * q + _HALF_SQRT3 * r for q, r in corners]
             ys = [1.5 * r for _, r in corners]
             min_x = min(xs) - sqrt3
             max_x = max(xs) + sqrt3
@@ -165,8 +250,14 @@ class FractalEditorScene(Scene):
             size_by_w = (panel.width - 2 * self.margin) / max(1e-6, span_x)
             size_by_h = (panel.height - 2 * self.margin) / max(1e-6, span_y)
             self.cell_size = int(max(8, min(size_by_w, size_by_h)))
-            self._hex_min_x = min_x
-            self._hex_min_y = min_y
+            size = self.cell_size
+            g2s = (
+                panel.left + self.margin - min_x * size,
+                panel.top + self.margin - min_y * size,
+                sqrt3 * size,
+                _HALF_SQRT3 * size,
+                1.5 * size,
+            )
         else:
             w = self.state.grid_x_max - self.state.grid_x_min
             h = self.state.grid_y_max - self.state.grid_y_min
@@ -174,73 +265,196 @@ class FractalEditorScene(Scene):
                 max(8, (panel.width - 2 * self.margin) // max(1, w)),
                 max(8, (panel.height - 2 * self.margin) // max(1, h)),
             )
+            size = self.cell_size
+            # y is inverted on screen
+            g2s = (
+                panel.left + self.margin - self.state.grid_x_min * size,
+                panel.top + self.margin + self.state.grid_y_max * size,
+                size,
+                0,
+                -size,
+            )
+
+        if g2s != self._g2s:
+            self._g2s = g2s
+            self._vertex_px = None
+            self._edge_px = None
+
+    def _graph_changed(self) -> None:
+        """Drop caches derived from state.vertices / state.edges."""
+        self._vertex_px = None
+        self._vertex_bucket_cache = None
+        self._pos_to_idx = None
+        self._edges_changed()
+
+    def _edges_changed(self) -> None:
+        """Drop caches derived from state.edges alone."""
+        self._edge_set_cache = None
+        self._edge_px = None
+
+    def _edge_set(self) -> set[Tuple[int, int]]:
+        """state.edges as a set, for O(1) duplicate checks."""
+        edge_set = self._edge_set_cache
+        if edge_set is None:
+            edge_set = self._edge_set_cache = set(self.state.edges)
+        return edge_set
+
+    def _vertex_screen_points(self, panel: pygame.Rect) -> List[Tuple[int, int]]:
+        """Screen position of every vertex, in state.vertices order."""
+        if self.cell_size <= 0:
+            self._compute_cell_size(panel)
+        pts = self._vertex_px
+        if pts is None:
+            to_screen = self._grid_to_screen
+            pts = self._vertex_px = [to_screen(vx, vy, panel) for vx, vy in self.state.vertices]
+        return pts
 
     def _vertex_at_screen(self, sx: int, sy: int, panel: pygame.Rect) -> Optional[int]:
+        pts = self._vertex_screen_points(panel)
         hit_radius = max(6, self.cell_size // 2)
-        for idx, (vx, vy) in enumerate(self.state.vertices):
-            px, py = self._grid_to_screen(vx, vy, panel)
-            if (sx - px) ** 2 + (sy - py) ** 2 <= hit_radius ** 2:
-                return idx
-        return None
+        r2 = hit_radius * hit_radius
+        # The hit radius is under one grid step, so only vertices snapped to
+        # the grid point under the cursor or one of its neighbors can be hit.
+        cq, cr = self._nearest_grid_point(*self._screen_to_grid(sx, sy, panel))
+        buckets = self._vertex_buckets()
+        hood = _HEX_NEIGHBORHOOD if self.state.grid_kind == "hex" else _RECT_NEIGHBORHOOD
+        best = None
+        for dq, dr in hood:
+            for idx in buckets.get((cq + dq, cr + dr), ()):
+                # Lowest index wins, as with a scan in vertex order.
+                if best is not None and idx >= best:
+                    continue
+                px, py = pts[idx]
+                dx = sx - px
+                dy = sy - py
+                if dx * dx + dy * dy <= r2:
+                    best = idx
+        return best
+
+    def _edge_screen_segments(self, panel: pygame.Rect) -> List[Tuple[int, int, int, int]]:
+        """(ax, ay, bx, by) screen endpoints of every edge, in state.edges order."""
+        segs = self._edge_px
+        if segs is None:
+            pts = self._vertex_screen_points(panel)
+            # -1 is the implicit root at (0,0).
+            root = self._grid_to_screen(0.0, 0.0, panel)
+            segs = self._edge_px = [
+                (pts[a] if a != -1 else root) + (pts[b] if b != -1 else root)
+                for a, b in self.state.edges
+            ]
+        return segs
+
+    def _edge_strokes(self, panel: pygame.Rect) -> List[List[Tuple[Color, Tuple[int, int], Tuple[int, int]]]]:
+        """Per edge, the (color, start, end) gradient sub-segments _draw strokes."""
+        segs = self._edge_screen_segments(panel)
+        if self._edge_strokes_src is not segs:
+            # Rebuilt whenever the endpoint list is (layout or edge change).
+            per_edge = []
+            half_cell = max(1, self.cell_size // 2)
+            for pax, pay, pbx, pby in segs:
+                # yellow (start) -> purple (end) gradient in thick segments
+                ddx = pbx - pax
+                ddy = pby - pay
+                steps = max(6, int(math.hypot(ddx, ddy) / half_cell))
+                ramp = self._edge_ramp(steps)
+                prev = (pax, pay)
+                strokes = []
+                for s in range(1, steps + 1):
+                    t = s / steps
+                    nxt = (int(pax + ddx * t), int(pay + ddy * t))
+                    strokes.append((ramp[s], prev, nxt))
+                    prev = nxt
+                per_edge.append(strokes)
+            self._edge_strokes_cache = per_edge
+            self._edge_strokes_src = segs
+        return self._edge_strokes_cache
+
+    def _vertex_index(self) -> dict[Vec2, int]:
+        """Vertex position -> index of its first occurrence in state.vertices."""
+        index = self._pos_to_idx
+        if index is None:
+            index = self._pos_to_idx = {}
+            for idx, v in enumerate(self.state.vertices):
+                index.setdefault(v, idx)
+        return index
+
+    def _vertex_buckets(self) -> dict[Tuple[int, int], List[int]]:
+        """Nearest grid point -> indices of the vertices snapped to it."""
+        buckets = self._vertex_bucket_cache
+        if buckets is None:
+            buckets = self._vertex_bucket_cache = {}
+            snap = self._nearest_grid_point
+            for idx, (vx, vy) in enumerate(self.state.vertices):
+                buckets.setdefault(snap(vx, vy), []).append(idx)
+        return buckets
+
+    def _edge_buckets(self, panel: pygame.Rect, thresh: int) -> Tuple[int, dict[Tuple[int, int], List[int]]]:
+        """Uniform screen grid: (cell px, {cell: edge indices whose grown bbox overlaps it})."""
+        segs = self._edge_screen_segments(panel)
+        if self._edge_buckets_src is not segs:
+            # Rebuilt whenever the endpoint list is (layout or edge change).
+            cell = max(2 * thresh, self.cell_size, 1)
+            buckets: dict[Tuple[int, int], List[int]] = {}
+            for i, (pax, pay, pbx, pby) in enumerate(segs):
+                x0 = (min(pax, pbx) - thresh) // cell
+                x1 = (max(pax, pbx) + thresh) // cell
+                y0 = (min(pay, pby) - thresh) // cell
+                y1 = (max(pay, pby) + thresh) // cell
+                for cx in range(x0, x1 + 1):
+                    for cy in range(y0, y1 + 1):
+                        buckets.setdefault((cx, cy), []).append(i)
+            self._edge_buckets_cache = (cell, buckets)
+            self._edge_buckets_src = segs
+        return self._edge_buckets_cache
 
     def _edge_at_screen(self, sx: int, sy: int, panel: pygame.Rect) -> Optional[int]:
         # simple distance to segment test
         thresh = max(6, self.cell_size // 2)
-        for i, (a_idx, b_idx) in enumerate(self.state.edges):
-            ax, ay = self._edge_point(a_idx)
-            bx, by = self._edge_point(b_idx)
-            pax, pay = self._grid_to_screen(ax, ay, panel)
-            pbx, pby = self._grid_to_screen(bx, by, panel)
-            if self._point_seg_dist(sx, sy, pax, pay, pbx, pby) <= thresh:
+        thresh_sq = thresh * thresh
+        segs = self._edge_screen_segments(panel)
+        cell, buckets = self._edge_buckets(panel, thresh)
+        # Candidates come back in edge order, so the first hit still wins.
+        for i in buckets.get((sx // cell, sy // cell), ()):
+            pax, pay, pbx, pby = segs[i]
+            # Cheap reject: the point must lie in the segment's bounding box
+            # grown by thresh before the exact distance is worth computing.
+            if pax < pbx:
+                if sx < pax - thresh or sx > pbx + thresh:
+                    continue
+            elif sx < pbx - thresh or sx > pax + thresh:
+                continue
+            if pay < pby:
+                if sy < pay - thresh or sy > pby + thresh:
+                    continue
+            elif sy < pby - thresh or sy > pay + thresh:
+                continue
+            # Squared point-segment distance, inlined: this runs for every
+            # edge near the cursor and the call overhead dominated.
+            dx = pbx - pax
+            dy = pby - pay
+            ex = sx - pax
+            ey = sy - pay
+            if dx or dy:
+                t = (ex * dx + ey * dy) / float(dx * dx + dy * dy)
+                if t > 1.0:
+                    t = 1.0
+                elif t < 0.0:
+                    t = 0.0
+                ex = sx - (pax + t * dx)
+                ey = sy - (pay + t * dy)
+            if ex * ex + ey * ey <= thresh_sq:
                 return i
         return None
 
     # --- hex helpers ---------------------------------------------------
 
-    def _nearest_hex_point(self, q: float, r: float) -> Vec2:
-        """Round axial coordinates to the nearest hex center."""
-        x = q
-        z = r
-        y = -x - z
-
-        rx, ry, rz = round(x), round(y), round(z)
-
-        dx = abs(rx - x)
-        dy = abs(ry - y)
-        dz = abs(rz - z)
-
-        if dx > dy and dx > dz:
-            rx = -ry - rz
-        elif dy > dz:
-            ry = -rx - rz
-        else:
-            rz = -rx - ry
-
-        return (rx, rz)
-
-    def _hex_corners(self, q: float, r: float, panel: pygame.Rect) -> List[Tuple[int, int]]:
-        """Return pixel coords for the corners of a hex at axial q,r."""
-        cx, cy = self._grid_to_screen(q, r, panel)
+    def _hex_corner_offsets(self) -> List[Tuple[float, float]]:
+        """_HEX_UNIT_CORNERS scaled to the current cell size."""
         size = self.cell_size
-        sqrt3 = math.sqrt(3)
-        corners = []
-        for i in range(6):
-            angle = math.radians(30 + 60 * i)  # pointy-top orientation
-            x = cx + size * math.cos(angle)
-            y = cy + size * math.sin(angle)
-            corners.append((int(x), int(y)))
-        return corners
-
-    def _point_seg_dist(self, px, py, x1, y1, x2, y2) -> float:
-        # distance from point to segment
-        dx, dy = x2 - x1, y2 - y1
-        if dx == dy == 0:
-            return math.hypot(px - x1, py - y1)
-        t = ((px - x1) * dx + (py - y1) * dy) / float(dx * dx + dy * dy)
-        t = max(0.0, min(1.0, t))
-        proj_x = x1 + t * dx
-        proj_y = y1 + t * dy
-        return math.hypot(px - proj_x, py - proj_y)
+        if self._hex_offsets_size != size:
+            self._hex_offsets = [(size * ux, size * uy) for ux, uy in _HEX_UNIT_CORNERS]
+            self._hex_offsets_size = size
+        return self._hex_offsets
 
     # ------------------------------------------------------------
     # Constraint checking
@@ -286,9 +500,7 @@ class FractalEditorScene(Scene):
             self.panel_rect = self.window_rect.copy()
 
         def push_undo() -> None:
-            self.undo_stack.append(
-                (list(self.state.vertices), list(self.state.edges), self.current_root, self.mode)
-            )
+            self.undo_stack.append([None, None, self.current_root, self.mode])
 
         def accept() -> None:
             # Enforce soft constraints on save
@@ -309,6 +521,10 @@ class FractalEditorScene(Scene):
 
                 # Map old index -> new index as we reorder
                 mapping = {i: i for i in range(len(verts))}
+                # First original index of each position
+                orig_idx: dict[Vec2, int] = {}
+                for i, v in enumerate(orig_verts):
+                    orig_idx.setdefault(v, i)
 
                 def move_vertex_to(pos: Vec2, target_idx: int) -> None:
                     nonlocal verts, mapping
@@ -324,10 +540,7 @@ class FractalEditorScene(Scene):
                         for new_i, v in enumerate(verts):
                             # use first matching old index for mapping updates
                             # (if duplicates, mapping may be ambiguous; we assume unique here)
-                            try:
-                                old_i = orig_verts.index(v)
-                            except ValueError:
-                                old_i = None
+                            old_i = orig_idx.get(v)
                             if old_i is not None:
                                 new_map[old_i] = new_i
                         mapping = new_map
@@ -371,16 +584,21 @@ class FractalEditorScene(Scene):
             manager.fractal_edit_result = None
             manager.pop_scene()
 
+        # The editor only changes in response to input, so the overlay is
+        # re-rendered when an event (or a panel resize) may have changed it.
+        self._dirty = True
+
+        # map mouse coords through renderer scaling if present (a bound
+        # method, so it follows fullscreen toggles)
+        to_surface = getattr(getattr(manager, "renderer", None), "_to_surface", None)
+
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     manager.set_scene(None)
                     return
-                # map mouse coords through renderer scaling if present
-                if hasattr(manager, "renderer") and hasattr(manager.renderer, "_to_surface"):
-                    to_surface = manager.renderer._to_surface  # type: ignore[attr-defined]
-                else:
-                    to_surface = None
+                if event.type != pygame.MOUSEMOTION:
+                    self._dirty = True
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         cancel()
@@ -413,19 +631,27 @@ class FractalEditorScene(Scene):
                     if event.key == pygame.K_z and (event.mod & pygame.KMOD_CTRL):
                         if self.undo_stack:
                             verts, edges, root, mode = self.undo_stack.pop()
-                            self.state.vertices = verts
-                            self.state.edges = edges
+                            if verts is not None or edges is not None:
+                                if verts is not None:
+                                    self.state.vertices = verts
+                                if edges is not None:
+                                    self.state.edges = edges
+                                self._graph_changed()
                             self.current_root = root
                             self.mode = mode
                             self.status_msg = ""
                     if event.key == pygame.K_f and self.selected_edge is not None:
                         push_undo()
+                        self._undo_touch(edges=True)
                         a, b = self.state.edges[self.selected_edge]
                         self.state.edges[self.selected_edge] = (b, a)
+                        self._edges_changed()
                     if event.key == pygame.K_DELETE:
                         if self.selected_edge is not None:
                             push_undo()
+                            self._undo_touch(edges=True)
                             self.state.edges.pop(self.selected_edge)
+                            self._edges_changed()
                             self.selected_edge = None
                         elif self.selected_vertex is not None:
                             push_undo()
@@ -446,11 +672,17 @@ class FractalEditorScene(Scene):
 
             # Update panel if full-screen and size changed
             if self.window_rect is None:
-                self.panel_rect = pygame.Rect(0, 0, renderer.width, renderer.height)
-
-            # Draw
-            surface.fill(renderer.bg)
-            self._draw(surface)
+                panel = pygame.Rect(0, 0, renderer.width, renderer.height)
+                if panel != self.panel_rect:
+                    self.panel_rect = panel
+                    self._dirty = True
+
+            # Draw. present() still runs every tick: display-level effects
+            # (shake, letterboxing after a resize) are applied there.
+            if self._dirty:
+                surface.fill(renderer.bg)
+                self._draw(surface)
+                self._dirty = False
             renderer.present()
             clock.tick(60)
 
@@ -491,13 +723,15 @@ class FractalEditorScene(Scene):
             # constraints are enforced only on accept/save.
 
             # avoid duplicate vertex positions
-            if (gx, gy) in self.state.vertices:
-                idx = self.state.vertices.index((gx, gy))
+            idx = self._vertex_index().get((gx, gy))
+            if idx is not None:
                 self.current_root = idx
                 self.selected_vertex = idx
                 self.selected_edge = None
                 return
+            self._undo_touch(vertices=True)
             self.state.vertices.append((gx, gy))
+            self._graph_changed()
             new_idx = len(self.state.vertices) - 1
             root_idx = self.current_root if self.current_root is not None else -1
             if self._add_edge(root_idx, new_idx):
@@ -516,8 +750,10 @@ class FractalEditorScene(Scene):
 
         elif self.mode == "flip":
             if e_hit is not None:
+                self._undo_touch(edges=True)
                 a, b = self.state.edges[e_hit]
                 self.state.edges[e_hit] = (b, a)
+                self._edges_changed()
                 self.selected_edge = e_hit
                 self.selected_vertex = None
                 return
@@ -558,50 +794,60 @@ class FractalEditorScene(Scene):
             self._delete_edge(e_hit)
             return
 
+    def _undo_touch(self, vertices: bool = False, edges: bool = False) -> None:
+        """Snapshot state lists into the open undo entry before mutating them."""
+        if not self.undo_stack:
+            return
+        entry = self.undo_stack[-1]
+        if vertices and entry[0] is None:
+            entry[0] = list(self.state.vertices)
+        if edges and entry[1] is None:
+            entry[1] = list(self.state.edges)
+
     def _delete_vertex(self, idx: int) -> None:
         if idx < 0 or idx >= len(self.state.vertices):
             return
 
-        # 1) Gather incoming and outgoing neighbors (using original indices).
-        # Note: src can be -1 for the implicit root at (0,0); we keep that.
-        incoming = [a for (a, b) in self.state.edges if b == idx]
-        outgoing = [b for (a, b) in self.state.edges if a == idx]
-
-        # 2) Build bridge edges from each incoming to each outgoing (A-B-C -> A-C).
-        bridge_edges: List[Tuple[int, int]] = []
-        for a in incoming:
-            for b in outgoing:
-                # Avoid self loops and trivial identities
-                if a == idx or b == idx or a == b:
-                    continue
-                bridge_edges.append((a, b))
-
-        # 3) Keep all existing edges that do NOT touch this vertex.
-        base_edges: List[Tuple[int, int]] = [
-            (a, b) for (a, b) in self.state.edges if a != idx and b != idx
-        ]
-
-        # 4) Add the bridge edges, avoiding duplicates.
-        existing = set(base_edges)
-        for e in bridge_edges:
-            if e not in existing:
-                base_edges.append(e)
-                existing.add(e)
-
-        # 5) After removing the vertex, indices > idx shift down by 1.
+        # 1) One pass over the edges: gather incoming and outgoing neighbors
+        # (using original indices) and keep all edges that do NOT touch this
+        # vertex. Kept edges are emitted already renumbered: after removing
+        # the vertex, indices > idx shift down by 1 (-1, the implicit root
+        # at (0,0), never does).
+        incoming: List[int] = []
+        outgoing: List[int] = []
         adjusted: List[Tuple[int, int]] = []
-        for a, b in base_edges:
-            na = a
-            nb = b
-            # Only adjust non-negative indices; -1 is the implicit root.
-            if isinstance(na, int) and na >= 0 and na > idx:
-                na = na - 1
-            if isinstance(nb, int) and nb >= 0 and nb > idx:
-                nb = nb - 1
-            adjusted.append((na, nb))
+        for e in self.state.edges:
+            a, b = e
+            if b == idx:
+                incoming.append(a)
+            if a == idx:
+                outgoing.append(b)
+            elif b != idx:
+                if a > idx or b > idx:
+                    e = (a - 1 if a > idx else a, b - 1 if b > idx else b)
+                adjusted.append(e)
+
+        # 2) Add bridge edges from each incoming to each outgoing (A-B-C -> A-C),
+        # renumbered the same way and avoiding duplicates.
+        if incoming and outgoing:
+            existing = set(adjusted)
+            for a in incoming:
+                for b in outgoing:
+                    # Avoid self loops and trivial identities
+                    if a == idx or b == idx or a == b:
+                        continue
+                    e = (a - 1 if a > idx else a, b - 1 if b > idx else b)
+                    if e not in existing:
+                        adjusted.append(e)
+                        existing.add(e)
 
+        self._undo_touch(vertices=True, edges=True)
         self.state.edges = adjusted
         self.state.vertices.pop(idx)
+        self._graph_changed()
+        if incoming and outgoing:
+            # `existing` now holds exactly the new edge list.
+            self._edge_set_cache = existing
 
         # Update current_root (draw origin) if needed.
         if self.current_root is not None:
@@ -623,7 +869,9 @@ class FractalEditorScene(Scene):
     def _delete_edge(self, idx: int) -> None:
         if idx < 0 or idx >= len(self.state.edges):
             return
+        self._undo_touch(edges=True)
         self.state.edges.pop(idx)
+        self._edges_changed()
         if self.selected_edge == idx:
             self.selected_edge = None
 
@@ -632,9 +880,13 @@ class FractalEditorScene(Scene):
             return False
         if b < 0 or b >= len(self.state.vertices):
             return False
-        if (a, b) in self.state.edges:
+        edge_set = self._edge_set()
+        if (a, b) in edge_set:
             return False
+        self._undo_touch(edges=True)
         self.state.edges.append((a, b))
+        edge_set.add((a, b))
+        self._edge_px = None
         return True
 
     # ------------------------------------------------------------
@@ -643,58 +895,35 @@ class FractalEditorScene(Scene):
         assert self.panel_rect is not None
         panel = self.panel_rect
 
-        # panel background
-        overlay = pygame.Surface((panel.width, panel.height), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (10, 10, 20, 230), overlay.get_rect())
-        pygame.draw.rect(overlay, (200, 200, 220, 255), overlay.get_rect(), 2)
-
-        # grid
+        # panel background + grid (the overlay is reused across frames; the
+        # static layer is copied over all of it, so no clearing is needed)
+        overlay = self._overlay
+        if overlay is None or overlay.get_size() != panel.size:
+            overlay = self._overlay = pygame.Surface(panel.size, pygame.SRCALPHA)
         self._compute_cell_size(panel)
-        if self.state.grid_kind == "hex":
-            for q in range(self.state.grid_x_min, self.state.grid_x_max + 1):
-                for r in range(self.state.grid_y_min, self.state.grid_y_max + 1):
-                    corners = self._hex_corners(q, r, panel)
-                    pygame.draw.polygon(overlay, (40, 50, 70), corners, 1)
-        else:
-            w = self.state.grid_x_max - self.state.grid_x_min
-            h = self.state.grid_y_max - self.state.grid_y_min
-            for gx in range(self.state.grid_x_min, self.state.grid_x_max + 1):
-                x, _ = self._grid_to_screen(gx, self.state.grid_y_min, panel)
-                _, y_top = self._grid_to_screen(gx, self.state.grid_y_max, panel)
-                pygame.draw.line(overlay, (40, 50, 70), (x, y_top), (x, y_top + h * self.cell_size))
-            for gy in range(self.state.grid_y_min, self.state.grid_y_max + 1):
-                x_left, y = self._grid_to_screen(self.state.grid_x_min, gy, panel)
-                x_right, _ = self._grid_to_screen(self.state.grid_x_max, gy, panel)
-                pygame.draw.line(overlay, (40, 50, 70), (x_left, y), (x_right, y))
+        overlay.blit(self._static_layer(panel), (0, 0))
 
         # edges
-        for i, (a_idx, b_idx) in enumerate(self.state.edges):
-            ax, ay = self._edge_point(a_idx)
-            bx, by = self._edge_point(b_idx)
-            pa = self._grid_to_screen(ax, ay, panel)
-            pb = self._grid_to_screen(bx, by, panel)
-            col_a = YELLOW  # start of edge
-            col_b = PURPLE  # end of edge
-            # draw gradient with thicker segments
-            steps = max(6, int(math.hypot(pb[0] - pa[0], pb[1] - pa[1]) / max(1, self.cell_size // 2)))
-            prev = pa
-            for s in range(1, steps + 1):
-                t = s / steps
-                nxt = (int(pa[0] + (pb[0] - pa[0]) * t), int(pa[1] + (pb[1] - pa[1]) * t))
-                col = self._lerp(col_a, col_b, t)
-                pygame.draw.line(overlay, col, prev, nxt, max(2, self.cell_size // 3))
-                prev = nxt
+        draw_line = pygame.draw.line
+        width = max(2, self.cell_size // 3)
+        for i, strokes in enumerate(self._edge_strokes(panel)):
+            for color, start, end in strokes:
+                draw_line(overlay, color, start, end, width)
             if self.selected_edge == i:
-                pygame.draw.circle(overlay, RED, ((pa[0] + pb[0]) // 2, (pa[1] + pb[1]) // 2), 6, 1)
-
-        # vertices
+                pax, pay, pbx, pby = self._edge_px[i]
+                pygame.draw.circle(overlay, RED, ((pax + pbx) // 2, (pay + pby) // 2), 6, 1)
+
+        # vertices: one pre-drawn sprite per (color, outline), blitted in a batch
+        vertex_pts = self._vertex_screen_points(panel)
+        radius = max(3, self.cell_size // 4)
+        off = radius + 2
+        sprite = self._vertex_sprite
+        blits = []
         for idx, (vx, vy) in enumerate(self.state.vertices):
-            px, py = self._grid_to_screen(vx, vy, panel)
-            base_col = self._color_for_x(vx)
-            radius = max(3, self.cell_size // 4)
-            pygame.draw.circle(overlay, base_col, (px, py), radius)
+            px, py = vertex_pts[idx]
             outline = CYAN if self.selected_vertex == idx else WHITE
-            pygame.draw.circle(overlay, outline, (px, py), radius + 2, 1)
+            blits.append((sprite(self._color_for_x(vx), outline, radius), (px - off, py - off)))
+        overlay.fblits(blits)
 
         # root/terminus markers: always at baseline (0,0) -> (10,0),
         # even if the grid extends beyond that.
@@ -739,13 +968,15 @@ class FractalEditorScene(Scene):
                 lines.append(self.status_msg)
 
             y = panel.height - 20 * len(lines) - 10
+            blits = []
             for ln in lines:
                 color = WHITE
                 if ln == self.status_msg:
                     color = RED
-                txt = self._small_font.render(ln, True, color)
-                overlay.blit(txt, (16, y))
+                txt = self._text(self._small_font, ln, color)
+                blits.append((txt, (16, y)))
                 y += txt.get_height() + 2
+            overlay.fblits(blits)
 
         # mode buttons on the right
         if self._font:
@@ -756,20 +987,82 @@ class FractalEditorScene(Scene):
                 color = (70, 90, 120) if self.mode != m else (120, 160, 210)
                 pygame.draw.rect(overlay, color, rect, border_radius=6)
                 pygame.draw.rect(overlay, (200, 220, 240), rect, 2, border_radius=6)
-                txt = self._font.render(label, True, WHITE)
+                txt = self._text(self._font, label, WHITE)
                 overlay.blit(txt, (rect.left + 8, rect.top + (btn_h - txt.get_height()) // 2))
 
         surface.blit(overlay, panel.topleft)
 
+    def _vertex_sprite(self, color: Color, outline: Color, radius: int) -> pygame.Surface:
+        """A vertex dot with its outline ring; the ring's center sits at (radius+2, radius+2)."""
+        key = (color, outline, radius)
+        sprite = self._vertex_sprites.get(key)
+        if sprite is None:
+            c = radius + 2
+            sprite = pygame.Surface((2 * c + 1, 2 * c + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (c, c), radius)
+            pygame.draw.circle(sprite, outline, (c, c), radius + 2, 1)
+            sprite = self._vertex_sprites[key] = sprite.convert_alpha()
+        return sprite
+
+    def _text(self, font: pygame.font.Font, text: str, color: Color) -> pygame.Surface:
+        """font.render(text, True, color), rendered once per (font, text, color)."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= 256:
+                # Counts/status lines vary; don't let stale ones pile up.
+                self._text_cache.clear()
+            surf = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surf
+
+    def _static_layer(self, panel: pygame.Rect) -> pygame.Surface:
+        """Panel background, border and grid for the current layout, drawn once per layout."""
+        key = (panel.size, self._g2s)
+        if self._static_cache is not None and self._static_cache_key == key:
+            return self._static_cache
+
+        layer = pygame.Surface(panel.size, pygame.SRCALPHA)
+        pygame.draw.rect(layer, (10, 10, 20, 230), layer.get_rect())
+        pygame.draw.rect(layer, (200, 200, 220, 255), layer.get_rect(), 2)
+        if self.state.grid_kind == "hex":
+            # Hex centers straight from the affine; cy is shared by each row.
+            ox, oy, axx, axy, ayy = self._g2s
+            offsets = self._hex_corner_offsets()
+            qs = range(self.state.grid_x_min, self.state.grid_x_max + 1)
+            for r in range(self.state.grid_y_min, self.state.grid_y_max + 1):
+                r_dx = axy * r
+                cy = int(oy + ayy * r)
+                for q in qs:
+                    cx = int(ox + axx * q + r_dx)
+                    corners = [(int(cx + dx), int(cy + dy)) for dx, dy in offsets]
+                    pygame.draw.polygon(layer, (40, 50, 70), corners, 1)
+        else:
+            h = self.state.grid_y_max - self.state.grid_y_min
+            for gx in range(self.state.grid_x_min, self.state.grid_x_max + 1):
+                x, _ = self._grid_to_screen(gx, self.state.grid_y_min, panel)
+                _, y_top = self._grid_to_screen(gx, self.state.grid_y_max, panel)
+                pygame.draw.line(layer, (40, 50, 70), (x, y_top), (x, y_top + h * self.cell_size))
+            for gy in range(self.state.grid_y_min, self.state.grid_y_max + 1):
+                x_left, y = self._grid_to_screen(self.state.grid_x_min, gy, panel)
+                x_right, _ = self._grid_to_screen(self.state.grid_x_max, gy, panel)
+                pygame.draw.line(layer, (40, 50, 70), (x_left, y), (x_right, y))
+
+        self._static_cache = layer.convert_alpha()
+        # Blit as a straight copy: the layer's translucent background must
+        # replace the previous frame, not blend over it.
+        self._static_cache.set_alpha(None)
+        self._static_cache_key = key
+        return self._static_cache
+
     # ------------------------------------------------------------
     # Helpers
 
-    def _edge_point(self, idx: int) -> Vec2:
-        if idx == -1:
-            return (0.0, 0.0)
-        return self.state.vertices[idx]
-
-    def _mode_button_rects(self, panel: pygame.Rect):
+    def _mode_button_rects(self, panel: pygame.Rect) -> List[Tuple[str, str, pygame.Rect]]:
+        # Only the panel's right edge moves the buttons; hit-testing and
+        # drawing share one list per layout.
+        cached = self._mode_rects_cache
+        if cached is not None and cached[0] == panel.right:
+            return cached[1]
         btn_w, btn_h = 140, 32
         right_x = panel.right - btn_w - 20
         top_y = 20
@@ -784,4 +1077,5 @@ class FractalEditorScene(Scene):
         for m, label in buttons:
             rects.append((m, label, pygame.Rect(right_x, y, btn_w, btn_h)))
             y += btn_h + 8
+        self._mode_rects_cache = (panel.right, rects)
         return rects
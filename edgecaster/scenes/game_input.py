@@ -38,7 +38,6 @@ def format_keybinding(code: int) -> str:
     return "+".join(parts)
 
 import pygame
-from copy import deepcopy
 
 # Default keymap for single-key commands (non-movement).
 DEFAULT_BINDINGS: Dict[str, List[int]] = {
@@ -89,15 +88,20 @@ DEFAULT_MOVE_BINDINGS: Dict[int, Tuple[int, int]] = {
 }
 
 
+def _default_bindings() -> Dict[str, List[int]]:
+    # Fresh lists, so callers can mutate them; the ints inside are immutable.
+    return {k: list(v) for k, v in DEFAULT_BINDINGS.items()}
+
+
 def _merge_default_bindings(binds: Dict[str, Iterable[int]]) -> Dict[str, List[int]]:
-    merged = deepcopy(DEFAULT_BINDINGS)
+    merged = _default_bindings()
     for k, vals in binds.items():
         merged[k] = list(vals)
     return merged
 
 
 def _merge_default_moves(moves: Dict[int, Tuple[int, int]]) -> Dict[int, Tuple[int, int]]:
-    merged = deepcopy(DEFAULT_MOVE_BINDINGS)
+    merged = dict(DEFAULT_MOVE_BINDINGS)
     for k, v in moves.items():
         merged[int(k)] = (int(v[0]), int(v[1]))
     return merged
@@ -108,36 +112,81 @@ def _bindings_path() -> Path:
     return Path(__file__).resolve().parent.parent / "keybindings.json"
 
 
+# ((mtime_ns, size), parsed bindings or None) for the last keybindings.json read.
+_bindings_file_cache: Optional[
+    Tuple[Tuple[int, int], Optional[Tuple[Dict[str, List[int]], Dict[int, Tuple[int, int]]]]]
+] = None
+
+
+def _parse_bindings(text: str) -> Optional[Tuple[Dict[str, List[int]], Dict[int, Tuple[int, int]]]]:
+    """Parse keybindings.json contents; None if it is not a bindings dict."""
+    data = json.loads(text)
+    if isinstance(data, dict) and "bindings" in data and "move_bindings" in data:
+        binds = {k: [int(v) for v in vals] for k, vals in data.get("bindings", {}).items()}
+        moves = {int(k): tuple(v) for k, v in data.get("move_bindings", {}).items()}
+        return binds, {k: (int(val[0]), int(val[1])) for k, val in moves.items()}
+    # Legacy: plain dict of bindings
+    if isinstance(data, dict):
+        binds = {k: [int(v) for v in vals] for k, vals in data.items()}
+        return _merge_default_bindings(binds), dict(DEFAULT_MOVE_BINDINGS)
+    return None
+
+
 def _load_bindings_file() -> Tuple[Dict[str, List[int]], Dict[int, Tuple[int, int]]]:
     """
     Load bindings (commands + movement) from disk; fall back to defaults on error.
+
+    The parsed file is cached until its mtime or size changes, so scenes that
+    build a GameInput don't re-read it; callers always get fresh containers.
     """
+    global _bindings_file_cache
     path = _bindings_path()
     try:
-        if path.exists():
-            data = json.loads(path.read_text())
-            if isinstance(data, dict) and "bindings" in data and "move_bindings" in data:
-                binds = {k: [int(v) for v in vals] for k, vals in data.get("bindings", {}).items()}
-                moves = {int(k): tuple(v) for k, v in data.get("move_bindings", {}).items()}
-                return binds, {k: (int(val[0]), int(val[1])) for k, val in moves.items()}
-            # Legacy: plain dict of bindings
-            if isinstance(data, dict):
-                binds = {k: [int(v) for v in vals] for k, vals in data.items()}
-                return _merge_default_bindings(binds), deepcopy(DEFAULT_MOVE_BINDINGS)
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if _bindings_file_cache is None or _bindings_file_cache[0] != stamp:
+            _bindings_file_cache = (stamp, _parse_bindings(path.read_text()))
+        parsed = _bindings_file_cache[1]
+        if parsed is not None:
+            binds, moves = parsed
+            return {k: list(v) for k, v in binds.items()}, dict(moves)
     except Exception:
         pass
-    return deepcopy(DEFAULT_BINDINGS), deepcopy(DEFAULT_MOVE_BINDINGS)
+    return _default_bindings(), dict(DEFAULT_MOVE_BINDINGS)
+
+
+# ((mtime_ns, size), text) of the last keybindings.json this process wrote.
+_bindings_file_written: Optional[Tuple[Tuple[int, int], str]] = None
 
 
 def save_bindings_file(bindings: Dict[str, Iterable[int]], move_bindings: Dict[int, Tuple[int, int]]) -> None:
-    """Persist bindings to disk."""
+    """
+    Persist bindings to disk.
+
+    The keybinds scene saves after every edit; when the file still holds
+    exactly what we last wrote and the new text is identical, the write is
+    skipped.
+    """
+    global _bindings_file_cache, _bindings_file_written
     path = _bindings_path()
     serial = {
         "bindings": {k: [int(v) for v in vals] for k, vals in bindings.items()},
         "move_bindings": {int(k): [int(v[0]), int(v[1])] for k, v in move_bindings.items()},
     }
+    text = json.dumps(serial, indent=2)
+    try:
+        if _bindings_file_written is not None and _bindings_file_written[1] == text:
+            st = path.stat()
+            if (st.st_mtime_ns, st.st_size) == _bindings_file_written[0]:
+                return
+    except Exception:
+        pass
+    _bindings_file_cache = None
+    _bindings_file_written = None
     try:
-        path.write_text(json.dumps(serial, indent=2))
+        path.write_text(text)
+        st = path.stat()
+        _bindings_file_written = ((st.st_mtime_ns, st.st_size), text)
     except Exception:
         pass
 
@@ -153,7 +202,7 @@ def load_bindings_full() -> Tuple[Dict[str, List[int]], Dict[int, Tuple[int, int
     return _load_bindings_file()
 
 
-@dataclass
+@dataclass(slots=True)
 class GameCommand:
     """Logical game command produced from raw keyboard / mouse input."""
     kind: str
@@ -168,6 +217,19 @@ class GameCommand:
 
 
 
+# (kind, raw_key) -> shared command for key presses that carry no other
+# payload. Commands are never mutated after creation, so one instance per
+# pair is reused instead of allocating a new one per keypress.
+_key_commands: Dict[Tuple[str, int], GameCommand] = {}
+
+
+def _key_command(kind: str, key: int) -> GameCommand:
+    cmd = _key_commands.get((kind, key))
+    if cmd is None:
+        cmd = _key_commands[(kind, key)] = GameCommand(kind, raw_key=key)
+    return cmd
+
+
 class GameInput:
     """
     Scene-level mapper from pygame KEYDOWN events to abstract game commands.
@@ -179,6 +241,31 @@ class GameInput:
     Keybindings are data-driven: override the dicts in __init__ to customize.
     """
 
+    # Bound kinds handled before any hard-wired key, in precedence order.
+    _GLOBAL_KINDS: Tuple[str, ...] = (
+        "escape",
+        "toggle_fullscreen",
+        "toggle_door",
+        "ability_page_prev",
+        "ability_page_next",
+    )
+    _GLOBAL_KIND_SET = frozenset(_GLOBAL_KINDS)
+    # Bound kinds handled after hotkeys/confirm, in precedence order.
+    _SIMPLE_KINDS: Tuple[str, ...] = (
+        "examine",
+        "pickup",
+        "possess_nearest",
+        "open_inventory",
+        "yawp",
+        "wait",
+        "stairs_down",
+        "stairs_up_or_map",
+        "open_fractal_editor",
+        "talk",
+        "quick_activate_all",
+        "look_action",
+    )
+
     def __init__(
         self,
         *,
@@ -194,50 +281,48 @@ class GameInput:
             self.set_bindings(bindings)
         if move_bindings:
             self.set_move_bindings(move_bindings)
+        self._rebuild_lookup()
 
     def set_bindings(self, bindings: Dict[str, Iterable[int]]) -> None:
         """Replace current bindings (used when reloading from options)."""
         self.bindings = _merge_default_bindings({k: list(v) for k, v in bindings.items()})
+        self._rebuild_lookup()
 
     def set_move_bindings(self, move_bindings: Dict[int, Tuple[int, int]]) -> None:
         """Replace current movement bindings."""
         self.move_bindings = _merge_default_moves({int(k): (int(v[0]), int(v[1])) for k, v in move_bindings.items()})
 
+    def _rebuild_lookup(self) -> None:
+        """
+        Index self.bindings as combined keycode -> kind for handle_keydown.
+        A code bound to several kinds maps to the first in precedence order.
+        """
+        lookup: Dict[int, str] = {}
+        for kind in self._GLOBAL_KINDS + self._SIMPLE_KINDS:
+            for code in self.bindings.get(kind, []):
+                lookup.setdefault(code, kind)
+        self._key_to_kind = lookup
+
     def handle_keydown(self, event: pygame.event.Event) -> List[GameCommand]:
         cmds: List[GameCommand] = []
         key = event.key
-        combined = encode_keybinding(key, event.mod)
-        uni = getattr(event, "unicode", "")
-
-        # --- Global-ish keys that should never combine with others ---
-
-        # Escape: close dialog/config/targeting, or pause.
-        if combined in self.bindings.get("escape", []):
-            return [GameCommand("escape", raw_key=key)]
-
-        # Fullscreen toggle
-        if combined in self.bindings.get("toggle_fullscreen", []):
-            return [GameCommand("toggle_fullscreen", raw_key=key)]
-
-        # Door toggle
-        if combined in self.bindings.get("toggle_door", []):
-            return [GameCommand("toggle_door", raw_key=key)]
-
-        # Ability bar page cycling
-        if combined in self.bindings.get("ability_page_prev", []):
-            return [GameCommand("ability_page_prev", raw_key=key)]
-        if combined in self.bindings.get("ability_page_next", []):
-            return [GameCommand("ability_page_next", raw_key=key)]
+        mod = event.mod
+        combined = encode_keybinding(key, mod)
 
+        bound = self._key_to_kind.get(combined)
 
+        # --- Global-ish keys that should never combine with others ---
+        # (escape, fullscreen, door toggle, ability bar page cycling)
+        if bound in self._GLOBAL_KIND_SET:
+            return [_key_command(bound, key)]
 
         # Help ('?')
-        if uni == "?":
-            return [GameCommand("show_help", raw_key=key)]
+        if event.unicode == "?":
+            return [_key_command("show_help", key)]
 
         # Ctrl+A to open abilities manager (without stealing plain 'a' movement)
-        if key == pygame.K_a and getattr(event, "mod", 0) & pygame.KMOD_CTRL:
-            return [GameCommand("open_abilities", raw_key=key)]
+        if key == pygame.K_a and mod & pygame.KMOD_CTRL:
+            return [_key_command("open_abilities", key)]
 
         # --- Ability hotkeys (1–10; '0' => 10) ---
         if pygame.K_1 <= key <= pygame.K_9:
@@ -249,33 +334,20 @@ class GameInput:
 
         # --- Confirm keys (ENTER / SPACE) ---
         if key in (pygame.K_RETURN, pygame.K_SPACE):
-            return [GameCommand("confirm", raw_key=key)]
+            return [_key_command("confirm", key)]
 
         # --- Single-key game actions that don't depend on direction ---
 
-        for kind in (
-            "examine",
-            "pickup",
-            "possess_nearest",
-            "open_inventory",
-            "yawp",
-            "wait",
-            "stairs_down",
-            "stairs_up_or_map",
-            "open_fractal_editor",
-            "talk",
-            "quick_activate_all",
-            "look_action",
-
-        ):
-            if combined in self.bindings.get(kind, []):
-                cmds.append(GameCommand(kind, raw_key=key))
-                return cmds
+        # Anything still bound here is one of _SIMPLE_KINDS.
+        if bound is not None:
+            cmds.append(_key_command(bound, key))
+            return cmds
 
         # --- Directional input (movement / cursor movement) ---
 
-        if combined in self.move_bindings:
-            cmds.append(GameCommand("move", vector=self.move_bindings[combined], raw_key=key))
+        vec = self.move_bindings.get(combined)
+        if vec is not None:
+            cmds.append(GameCommand("move", vector=vec, raw_key=key))
 
  
         return cmds
@@ -288,8 +360,8 @@ class GameInput:
         return [
             GameCommand(
                 kind="mouse_click",
-                mouse_pos=getattr(event, "pos", None),
-                mouse_button=getattr(event, "button", None),
+                mouse_pos=event.pos,
+                mouse_button=event.button,
             )
         ]
 
@@ -298,7 +370,7 @@ class GameInput:
         return [
             GameCommand(
                 kind="mouse_move",
-                mouse_pos=getattr(event, "pos", None),
+                mouse_pos=event.pos,
             )
         ]
 
@@ -307,6 +379,6 @@ class GameInput:
         return [
             GameCommand(
                 kind="mouse_wheel",
-                wheel_y=getattr(event, "y", 0),
+                wheel_y=event.y,
             )
         ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import is_
 from typing import Optional, TYPE_CHECKING
 
 import pygame
@@ -50,6 +51,12 @@ class InventoryScene(PopupMenuScene):
 
         self.overlay_layers = {"hud"}
 
+        # (owner_id, inventory entities, labels) from the last get_menu_items().
+        self._items_cache: Optional[tuple[str, tuple, list[str]]] = None
+        # ((owner_id, exclude_id), inventory entities, targets) from the last
+        # _find_container_targets() call.
+        self._targets_cache: Optional[tuple[tuple, tuple, list[tuple[str, str]]]] = None
+
         # Effects: inherit from parent + add owner/container declared effects
         self.visual_effects: list[str] = list(base_effects or [])
         self._inherit_owner_visual_effects()
@@ -58,8 +65,9 @@ class InventoryScene(PopupMenuScene):
     # Effects inheritance (no inventory-specific math here)
     # ---------------------------------------------------------------------
 
-    def _find_owner_entity(self):
-        owner_id = self._owner_id()
+    def _find_owner_entity(self, owner_id: Optional[str] = None):
+        if owner_id is None:
+            owner_id = self._owner_id()
 
         level = self.game._level()
         if level is not None:
@@ -67,11 +75,16 @@ class InventoryScene(PopupMenuScene):
             if ent is not None:
                 return ent
 
-        for cand in getattr(self.game, "player_inventory", []):
-            if getattr(cand, "id", None) == owner_id:
-                return cand
+        # A nested container normally sits in the inventory it was opened
+        # from, so look there before scanning every inventory. (The player's
+        # inventory is one of game.inventories, so the full scan covers it.)
+        inventories = getattr(self.game, "inventories", {})
+        if self.parent_owner_id is not None:
+            for cand in inventories.get(self.parent_owner_id, ()):
+                if getattr(cand, "id", None) == owner_id:
+                    return cand
 
-        for inv_list in getattr(self.game, "inventories", {}).values():
+        for inv_list in inventories.values():
             for cand in inv_list:
                 if getattr(cand, "id", None) == owner_id:
                     return cand
@@ -85,7 +98,7 @@ class InventoryScene(PopupMenuScene):
         if owner_id == self.game.player_id:
             return
 
-        ent = self._find_owner_entity()
+        ent = self._find_owner_entity(owner_id)
         if ent is None:
             return
 
@@ -105,6 +118,19 @@ class InventoryScene(PopupMenuScene):
         """
         space_owner_id = self._owner_id()
         inv = self.game.get_inventory(space_owner_id)
+
+        # on_activate and the "Put into..." choice both ask; reuse the scan
+        # while the inventory holds the same entities.
+        key = (space_owner_id, exclude_id)
+        cached = self._targets_cache
+        if (
+            cached is not None
+            and cached[0] == key
+            and len(cached[1]) == len(inv)
+            and all(map(is_, cached[1], inv))
+        ):
+            return list(cached[2])
+
         candidates: list[tuple[str, str]] = []
 
         for ent in inv:
@@ -118,7 +144,8 @@ class InventoryScene(PopupMenuScene):
             if ent_id is not None:
                 candidates.append((ent_id, name))
 
-        return candidates
+        self._targets_cache = (key, tuple(inv), candidates)
+        return list(candidates)
 
     # ---------------------------------------------------------------------
     # MenuScene hooks
@@ -129,10 +156,21 @@ class InventoryScene(PopupMenuScene):
         Return a simple list of inventory item names plus a Back option.
         (Restores stable behavior: no '[Take]' prefixes on the main list.)
         """
-        items: list[str] = []
         owner_id = self._owner_id()
         inv = self.game.get_inventory(owner_id)
 
+        # The menu loop asks for this every frame; rebuild the labels only
+        # when the inventory holds different entities.
+        cached = self._items_cache
+        if (
+            cached is not None
+            and cached[0] == owner_id
+            and len(cached[1]) == len(inv)
+            and all(map(is_, cached[1], inv))
+        ):
+            return cached[2]
+
+        items: list[str] = []
         if inv:
             for ent in inv:
                 name = getattr(ent, "name", None) or "(unnamed item)"
@@ -140,6 +178,7 @@ class InventoryScene(PopupMenuScene):
         else:
             items.append("(Empty)")
         items.append("Back")
+        self._items_cache = (owner_id, tuple(inv), items)
         return items
 
     def on_activate(self, index: int, manager: "SceneManager") -> bool:
@@ -296,7 +335,7 @@ class InventoryScene(PopupMenuScene):
                         self.game,
                         owner_id=nested_owner_id,
                         window_rect=nested_rect,
-                        parent_owner_id=self._owner_id(),
+                        parent_owner_id=current_owner_id,
                         title=popup_title,
                         base_effects=self.visual_effects,
                     )
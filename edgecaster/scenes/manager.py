@@ -229,7 +229,19 @@ class SceneManager:
             dt = clock.tick(60)
 
             # Events
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            last = len(events) - 1
+            for i, event in enumerate(events):
+                # A run of motion events only matters for its final position
+                # (live scenes track hover from pos, not rel), so skip all but
+                # the last one of each run.
+                if (
+                    event.type == pygame.MOUSEMOTION
+                    and i < last
+                    and events[i + 1].type == pygame.MOUSEMOTION
+                ):
+                    continue
+
                 if event.type == pygame.QUIT:
                     self.set_scene(None)
                     return
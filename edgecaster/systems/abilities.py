@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
 from edgecaster.game import Game
-from edgecaster.systems.actions import get_action
+from edgecaster.systems.actions import find_action
 from edgecaster.patterns.library import action_preview_geometry
 
 
@@ -68,11 +68,8 @@ def compute_abilities_signature(game: Game) -> Tuple[
 
     if host is not None:
         for name in getattr(host, "actions", ()) or ():
-            try:
-                adef = get_action(name)
-            except Exception:
-                continue
-            if getattr(adef, "show_in_bar", False):
+            adef = find_action(name)
+            if adef is not None and adef.show_in_bar:
                 host_actions.append(name)
 
     host_sig = tuple(sorted(set(host_actions)))
@@ -102,12 +99,11 @@ def build_abilities(game: Game) -> List[Ability]:
 
     def add_from_action_name(name: str) -> None:
         nonlocal hotkey
-        try:
-            adef = get_action(name)
-        except Exception:
+        adef = find_action(name)
+        if adef is None:
             # Unknown / unregistered action; ignore for the bar.
             return
-        if not getattr(adef, "show_in_bar", False):
+        if not adef.show_in_bar:
             return
         preview = action_preview_geometry(adef.name, game)
         abilities.append(Ability(name=adef.label, hotkey=hotkey, action=adef.name, preview_geom=preview))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Literal, Protocol
 from pathlib import Path
@@ -228,6 +229,14 @@ class ActionDef:
 # Global registry of all actions by name.
 _action_registry: Dict[str, ActionDef] = {}
 
+# name -> TargetingSpec (None for unknown / untargeted actions). Cleared
+# whenever an action is (re-)registered.
+_targeting_cache: Dict[str, TargetingSpec | None] = {}
+
+# name -> ActionDef (None for unknown names), memoized by find_action().
+# Cleared alongside _targeting_cache.
+_action_cache: Dict[str, ActionDef | None] = {}
+
 
 
 # ---------------------------------------------------------------------------
@@ -350,8 +359,14 @@ def register_action(
     """
     Decorator to register a function as an Action.
     """
+    # ActionDef.name ends up in the ability bar's order/active_action, so
+    # intern it: equality checks against it then short-circuit on identity.
+    name = sys.intern(name)
+
     def decorator(func: ActionFunc) -> ActionFunc:
         # Dev convenience: allow override if hot–reloading.
+        _targeting_cache.clear()
+        _action_cache.clear()
         _action_registry[name] = ActionDef(
             name=name,
             label=label,
@@ -373,9 +388,19 @@ def get_action(name: str) -> ActionDef:
 
     Raises KeyError if the action is unknown.
     """
+    action_def = _lookup_action(name)
+    if action_def is None:
+        known = ", ".join(sorted(_action_registry)) or "<none>"
+        raise KeyError(f"Unknown action '{name}'. Known actions: {known}")
+    return action_def
+
+
+def _lookup_action(name: str) -> ActionDef | None:
+    """Registry lookup behind get_action()/find_action(); None if unknown."""
     # On-demand aliases for custom_N -> same base but passing through the suffix.
     if name.startswith("custom_") and "custom" in _action_registry:
         if name not in _action_registry:
+            name = sys.intern(name)
             base = _action_registry["custom"]
 
             def _custom_n_action(game: Any, actor_id: str, **kwargs: Any) -> None:
@@ -393,11 +418,35 @@ def get_action(name: str) -> ActionDef:
             )
         return _action_registry[name]
 
+    return _action_registry.get(name)
+
+
+def find_action(name: str) -> ActionDef | None:
+    """
+    Like get_action(), but returns None for unknown names instead of
+    raising. Cached per name (misses included) for UI hot paths.
+    """
     try:
-        return _action_registry[name]
-    except KeyError as exc:
-        known = ", ".join(sorted(_action_registry)) or "<none>"
-        raise KeyError(f"Unknown action '{name}'. Known actions: {known}") from exc
+        return _action_cache[name]
+    except KeyError:
+        pass
+    action_def = _action_cache[name] = _lookup_action(name)
+    return action_def
+
+
+def action_targeting(name: str) -> TargetingSpec | None:
+    """
+    Targeting spec for an action name, or None if the action is unknown
+    or untargeted. Cached per name, for hot paths like the mouse wheel.
+    """
+    try:
+        return _targeting_cache[name]
+    except KeyError:
+        pass
+    action_def = find_action(name)
+    spec = action_def.targeting if action_def is not None else None
+    _targeting_cache[name] = spec
+    return spec
 
 
 def action_delay(cfg: Any, action_def: ActionDef) -> int:
@@ -49,6 +49,9 @@ class AbilityBarState:
     active_action: Optional[str] = None
 
     _signature: Optional[Tuple] = None  # compute_abilities_signature(game)
+    # action -> Ability for `abilities`; rebuilt only when that list is swapped out.
+    _by_action: Dict[str, Ability] = field(default_factory=dict, repr=False)
+    _by_action_src: Optional[List[Ability]] = field(default=None, repr=False)
 
     # ---- core sync ---------------------------------------------------
 
@@ -81,12 +84,16 @@ class AbilityBarState:
 
             self._sync_selection_to_active()
         else:
-            # Signature hasn't changed, but keep order consistent with abilities
-            existing_actions = {ab.action for ab in self.abilities}
-            self.order = [a for a in self.order if a in existing_actions]
-            for a in [ab.action for ab in self.abilities]:
-                if a not in self.order:
-                    self.order.append(a)
+            # Signature hasn't changed, but keep order consistent with abilities.
+            # The action index's keys are the ability names, so the usual
+            # "order is already a permutation of them" case needs no Ability scan.
+            by_action = self._abilities_by_action()
+            order = self.order
+            if len(order) != len(by_action) or not all(a in by_action for a in order):
+                self.order = [a for a in order if a in by_action]
+                for a in by_action:
+                    if a not in self.order:
+                        self.order.append(a)
 
             if self.active_action not in self.order and self.order:
                 self.active_action = self.order[0]
@@ -114,9 +121,41 @@ class AbilityBarState:
         start = self.page * self.page_size
         end = start + self.page_size
         slice_actions = self.order[start:end]
-        by_action: Dict[str, Ability] = {ab.action: ab for ab in self.abilities}
+        by_action = self._abilities_by_action()
         return [by_action[a] for a in slice_actions if a in by_action]
 
+    def ability_for_hotkey(self, hotkey: int) -> Optional[Ability]:
+        """
+        Ability bound to the page-local hotkey 1..page_size, or None.
+        """
+        if not 1 <= hotkey <= self.page_size:
+            return None
+        action = self.action_at_index(self.page * self.page_size + hotkey - 1)
+        if action is None:
+            return None
+        return self._abilities_by_action().get(action)
+
+    def confirm_ability(self) -> Optional[Ability]:
+        """
+        Ability that confirm fires: the active one if it is on the visible
+        page, else the page's first ability (None for an empty page).
+        """
+        if not self.order:
+            return None
+        start = self.page * self.page_size
+        page_actions = self.order[start:start + self.page_size]
+        by_action = self._abilities_by_action()
+        active = self.active_action
+        if active in page_actions:
+            ability = by_action.get(active)
+            if ability is not None:
+                return ability
+        for a in page_actions:
+            ability = by_action.get(a)
+            if ability is not None:
+                return ability
+        return None
+
     def active_index_on_page(self) -> Optional[int]:
         """
         Index *within the visible page* for the currently active action, or None.
@@ -200,6 +239,12 @@ class AbilityBarState:
 
     # ---- internal helpers -------------------------------------------
 
+    def _abilities_by_action(self) -> Dict[str, Ability]:
+        if self._by_action_src is not self.abilities:
+            self._by_action = {ab.action: ab for ab in self.abilities}
+            self._by_action_src = self.abilities
+        return self._by_action
+
     def _sync_selection_to_active(self) -> None:
         if self.active_action in self.order:
             self.selected_index = self.order.index(self.active_action)
@@ -249,8 +294,18 @@ class AbilityBarRenderer:
         self.page_prev_rect: Optional[pygame.Rect] = None
         self.page_next_rect: Optional[pygame.Rect] = None
         # Multiple arrow hitboxes (e.g., above/below on both sides) that all map to prev/next.
+        # These are the complete lists: page_prev_rect/page_next_rect are appended too.
         self.page_prev_rects: List[pygame.Rect] = []
         self.page_next_rects: List[pygame.Rect] = []
+        # Flat click index for the visible slots: (rect, ability, role) with
+        # role in {"plus", "minus", "gear", "main"}. Sub-buttons are listed
+        # before their slot so the first hit wins. hit_abilities/hit_page
+        # record which bar model the index was drawn from, so callers can
+        # tell when it has gone stale.
+        self.bar_rect: Optional[pygame.Rect] = None
+        self.hit_rects: List[Tuple[pygame.Rect, Ability, str]] = []
+        self.hit_abilities: Optional[List[Ability]] = None
+        self.hit_page: int = 0
 
     # ------------------------------------------------------------------
     # Helpers
@@ -330,6 +385,9 @@ class AbilityBarRenderer:
         self.page_next_rect = None
         self.page_prev_rects = []
         self.page_next_rects = []
+        self.bar_rect = bar_rect
+        self.hit_rects = []
+        hit_rects = self.hit_rects
 
         for ab in bar_state.abilities:
             # We deliberately only clear the attributes we own.
@@ -409,6 +467,8 @@ class AbilityBarRenderer:
 
         # --- visible abilities ----------------------------------------
         vis = bar_state.visible_abilities()
+        self.hit_abilities = bar_state.abilities
+        self.hit_page = bar_state.page
         slot_rects = self._layout_bar(bar_rect, len(vis))
 
         for ability, rect in zip(vis, slot_rects):
@@ -490,6 +550,12 @@ class AbilityBarRenderer:
 
                     cur_x -= sub_gap
 
+            for role in ("plus", "minus", "gear"):
+                sub_rect = getattr(ability, role + "_rect", None)
+                if sub_rect:
+                    hit_rects.append((sub_rect, ability, role))
+            hit_rects.append((rect, ability, "main"))
+
         # After drawing the base bar, optionally paint the reorder overlay on top.
         if getattr(game, "ability_reorder_open", False):
             self._draw_reorder_overlay(
@@ -546,7 +612,7 @@ class AbilityBarRenderer:
 
         # All abilities in current order
         actions = bar_state.order
-        abilities_by_action: Dict[str, Ability] = {ab.action: ab for ab in bar_state.abilities}
+        abilities_by_action = bar_state._abilities_by_action()
 
         start_idx = 0
         if bar_state.selected_index >= max_rows: